@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+from typing import Any, Callable
+
+import pytest
+
+from reactable.simpleframe import SimpleFrame
+
+# (rows, columns) of the benchmarked tables. Large shapes only run with --bench-large,
+# since building them takes minutes and gigabytes of memory.
+SHAPES = [(1_000, 5), (100_000, 5), (1_000, 200)]
+LARGE_SHAPES = [(1_000_000, 5), (1_000, 2_000), (100_000, 200)]
+
+KINDS = ["simple", "pandas", "polars"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-large",
+        action="store_true",
+        default=False,
+        help="also benchmark large tables (up to 1M rows, or 2,000 columns)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "shape" in metafunc.fixturenames:
+        shapes = SHAPES + (LARGE_SHAPES if metafunc.config.getoption("bench_large") else [])
+        metafunc.parametrize("shape", shapes, ids=[f"{n}x{k}" for n, k in shapes])
+
+    if "kind" in metafunc.fixturenames:
+        metafunc.parametrize("kind", KINDS)
+
+
+def make_columns(n_rows: int, n_cols: int) -> dict[str, list[Any]]:
+    """Return columns that cycle through ints, floats, strings, and booleans (with missing)."""
+    makers: list[Callable[[int], Any]] = [
+        lambda ii: ii,
+        lambda ii: ii / 7 if ii % 11 else None,
+        lambda ii: f"level {ii % 50}",
+        lambda ii: ii % 3 == 0,
+    ]
+
+    # columns of the same type share values, so building wide tables stays cheap
+    values = [[make(ii) for ii in range(n_rows)] for make in makers]
+    return {f"col_{jj}": list(values[jj % len(values)]) for jj in range(n_cols)}
+
+
+_frames: dict[tuple, Any] = {}
+
+
+@pytest.fixture
+def data(kind: str, shape: tuple[int, int]):
+    key = (kind, shape)
+    if key not in _frames:
+        # only keep one frame around, since the large ones take a lot of memory
+        _frames.clear()
+        columns = make_columns(*shape)
+
+        if kind == "simple":
+            _frames[key] = SimpleFrame(columns)
+        elif kind == "pandas":
+            pd = pytest.importorskip("pandas")
+            _frames[key] = pd.DataFrame(columns)
+        elif kind == "polars":
+            pl = pytest.importorskip("polars")
+            _frames[key] = pl.DataFrame(columns, strict=False)
+
+    return _frames[key]
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Return the peak memory in bytes allocated (by python) while calling func."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def payload_bytes(props: dict[str, Any]) -> int:
+    """Return the size in bytes of props sent to the widget, as json."""
+    return len(json.dumps(props).encode())
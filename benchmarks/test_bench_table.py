@@ -0,0 +1,77 @@
+"""Benchmarks for building, serializing, and sizing tables.
+
+Each benchmark records the peak memory (from tracemalloc) of a single run, and the size
+of the json payload, in the benchmark's extra_info. See the bench targets in the Makefile
+for running these, and comparing against the stored baseline.
+"""
+
+import pytest
+
+from reactable import Column, Reactable, options
+from reactable._cache import get_props_cache
+from reactable._serialize import dumps
+
+from .conftest import payload_bytes, peak_memory
+
+
+def _callback_columns(data) -> dict[str, Column]:
+    # a python rendered cell for every column, as in reports that format each value
+    from reactable._tbl_data import column_names
+
+    return {name: Column(cell=lambda ci: f"<{ci.value}>") for name in column_names(data)}
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "callbacks"])
+def table_kwargs(request, data):
+    if request.param:
+        return {"columns": _callback_columns(data), "row_style": lambda ri: {"color": "red"}}
+
+    return {}
+
+
+def test_construct(benchmark, data, table_kwargs):
+    benchmark.extra_info["peak_memory"] = peak_memory(lambda: Reactable(data, **table_kwargs))
+    benchmark.pedantic(Reactable, args=(data,), kwargs=table_kwargs, rounds=3)
+
+
+def test_to_props(benchmark, data, table_kwargs):
+    tbl = Reactable(data, **table_kwargs)
+
+    benchmark.extra_info["peak_memory"] = peak_memory(tbl.to_props)
+    benchmark.extra_info["payload_bytes"] = payload_bytes(tbl.to_props())
+    benchmark.pedantic(tbl.to_props, rounds=3)
+
+
+@pytest.mark.parametrize("hit", [False, True], ids=["miss", "hit"])
+def test_cached_props(benchmark, data, hit):
+    # props are cached when a table is displayed, so a hit should be quicker than to_props
+    tbl = Reactable(data)
+    cache = get_props_cache(options.cache_size)
+
+    def cached_props():
+        if not hit:
+            cache.clear()
+
+        return tbl._cached_props()
+
+    cached_props()
+    benchmark.pedantic(cached_props, rounds=3)
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_json_encode(benchmark, data, backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    props = Reactable(data).to_props()
+
+    benchmark.extra_info["peak_memory"] = peak_memory(lambda: dumps(props, backend))
+    benchmark.extra_info["payload_bytes"] = payload_bytes(props)
+    benchmark.pedantic(dumps, args=(props, backend), rounds=3)
+
+
+def test_payload_size(benchmark, data):
+    tbl = Reactable(data)
+
+    props = benchmark.pedantic(tbl.to_props, rounds=1)
+    benchmark.extra_info["payload_bytes"] = payload_bytes(props)
@@ -14,12 +14,39 @@ from .models import (
     Language,
     JS,
 )
-from .widgets import ReactableWidget, embed_css, bigblock
 from .tags import to_widget
+from ._html import to_html
+from ._sources import data_source
+from ._sql import sql_table
 from .options import options
-from .render_gt import render
+from ._profile import profile
+
+# Widget classes are imported on first use, since they require loading ipyreact,
+# ipywidgets, and IPython. This keeps building tables (e.g. with .to_props()) fast.
+_LAZY_ATTRS = {
+    "ReactableWidget": ("widgets", "ReactableWidget"),
+    "embed_css": ("widgets", "embed_css"),
+    "bigblock": ("widgets", "bigblock"),
+    "reactable": ("widgets", "bigblock"),
+    "render": ("render_gt", "render"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+
+        mod_name, attr_name = _LAZY_ATTRS[name]
+        res = getattr(import_module(f".{mod_name}", __name__), attr_name)
+        globals()[name] = res
+        return res
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
 
-reactable = bigblock
 
 __all__ = [
     # table classes ----
@@ -30,6 +57,8 @@ __all__ = [
     "ColFormatGroupBy",
     "Theme",
     "Language",
+    "data_source",
+    "sql_table",
     # renderer data classes ----
     "CellInfo",
     "ColInfo",
@@ -38,7 +67,9 @@ __all__ = [
     "JS",
     # global options ----
     "options",
+    "profile",
     "to_widget",
+    "to_html",
     # TODO: remove ----
     "reactable",
 ]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import warnings
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from ._cache import payload_size
+from ._tbl_data import WidgetColTypes
+
+# sizes are estimated from the first rows of a table, and scaled up to the full table.
+# Wide tables sample fewer rows, so estimating takes about the same time for any table.
+SAMPLE_SIZE = 100
+MIN_SAMPLE_SIZE = 10
+SAMPLE_CELLS = 5_000
+
+# rough bytes the browser uses for each row object, and each value in it. Strings take
+# two bytes per character on top of this.
+CLIENT_ROW_BYTES = 64
+CLIENT_VALUE_BYTES = 16
+
+
+@dataclass
+class MemoryUsage:
+    """Estimated sizes of a table, and the data sent to the browser.
+
+    Sizes are estimated from a sample of rows, so are approximate. The size of the data is
+    only estimated when it's needed.
+
+    Attributes
+    ----------
+    n_rows:
+        The number of rows in the table.
+    client_bytes:
+        The estimated memory the table's data takes up in the browser.
+    callback_bytes:
+        The size of the output of python callbacks (e.g. rendered cells and row styles).
+    budget:
+        The most bytes of data the table could send, from `options.payload_budget`.
+    """
+
+    n_rows: int
+    client_bytes: int
+    callback_bytes: int = 0
+    budget: int | None = None
+
+    _sample: dict[str, list[Any]] = field(default_factory=dict, repr=False)
+    _column_bytes: dict[str, int] | None = field(default=None, repr=False)
+
+    def column_bytes(self) -> dict[str, int]:
+        """Return the estimated size of each column's data, as json."""
+        if self._column_bytes is None:
+            scale = _scale(self._sample, self.n_rows)
+            self._column_bytes = {
+                name: int(payload_size(values) * scale) for name, values in self._sample.items()
+            }
+
+        return self._column_bytes
+
+    def payload_bytes(self) -> int:
+        """Return the estimated size of the table's data, as json."""
+        return sum(self.column_bytes().values())
+
+    @property
+    def sent_bytes(self) -> int:
+        """The estimated size of the data and callback output sent."""
+        return self.payload_bytes() + self.callback_bytes
+
+    def fits(self) -> bool:
+        if self.budget is None:
+            return True
+
+        # callback output alone may be over budget, without estimating the data
+        return self.callback_bytes <= self.budget and self.sent_bytes <= self.budget
+
+    def warn_if_over_budget(self) -> None:
+        if not self.fits():
+            warnings.warn(
+                f"Table data is estimated at {self.sent_bytes:,} bytes, which is over the "
+                f"payload budget of {self.budget:,} bytes (options.payload_budget). "
+                "It may be slow to show, so consider selecting fewer rows or columns.",
+                stacklevel=4,
+            )
+
+    def __str__(self) -> str:
+        lines = [
+            f"rows: {self.n_rows:,}",
+            f"payload: {self.payload_bytes():,} bytes",
+            f"callback output: {self.callback_bytes:,} bytes",
+            f"browser memory: {self.client_bytes:,} bytes",
+        ]
+        if self.budget is not None:
+            lines.append(f"budget: {self.budget:,} bytes")
+
+        return "\n".join(lines)
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+
+def _client_value_bytes(values: list[Any], type_: WidgetColTypes) -> int:
+    chars = sum(len(val) for val in values if isinstance(val, str))
+    if type_ == "Date":
+        # dates are sent as strings, and parsed when sorting
+        chars += sum(len(str(val)) for val in values if val is not None)
+
+    return CLIENT_VALUE_BYTES * len(values) + 2 * chars
+
+
+def sample_size(n_columns: int) -> int:
+    """Return the number of rows to sample, for a table with n_columns."""
+    return max(MIN_SAMPLE_SIZE, min(SAMPLE_SIZE, SAMPLE_CELLS // max(n_columns, 1)))
+
+
+def _scale(sample: dict[str, list[Any]], n_rows: int) -> float:
+    n_sample = len(next(iter(sample.values()), []))
+    return n_rows / n_sample if n_sample else 0
+
+
+def estimate_memory_usage(
+    sample: dict[str, list[Any]],
+    n_rows: int,
+    col_types: dict[str, WidgetColTypes],
+) -> MemoryUsage:
+    """Estimate the size of a table from a sample of its first rows, as lists of values."""
+    scale = _scale(sample, n_rows)
+
+    client_bytes = CLIENT_ROW_BYTES * n_rows
+    for name, values in sample.items():
+        client_bytes += int(_client_value_bytes(values, col_types.get(name)) * scale)
+
+    return MemoryUsage(n_rows, client_bytes, _sample=sample)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import weakref
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import singledispatch
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from ._tbl_data import PdSeries, PlSeries
+from .simpleframe import SimpleColumn
+
+if TYPE_CHECKING:
+    from ._column_store import ColumnStore
+    from .widgets import ReactableWidget
+
+
+# fingerprints --------------------------------------------------------
+# Fingerprints identify a table by hashing its data buffers and config, so tables
+# displayed more than once in a kernel can re-use their props. They are only
+# compared within a single process, so may use hashes seeded per process.
+#
+# A fingerprint is only worth computing if it's cheaper than converting the data to
+# props. Columns of python objects (e.g. lists, or pandas object columns) are converted
+# without much more than a copy, and hashing them takes longer, so tables with them are
+# not cached.
+
+
+class Unfingerprintable(Exception):
+    """Raised for columns that are slower to hash than to convert to props."""
+
+
+def _update_values(values: list[Any], h: blake2b) -> None:
+    # values are hashed along with their types, since values of different types may
+    # look the same (e.g. when converted to strings)
+    h.update(repr(values).encode())
+    h.update(repr(list(map(type, values))).encode())
+
+
+@singledispatch
+def update_digest(x: Any, h: blake2b) -> None:
+    """Add the contents of a column to a hash."""
+    raise Unfingerprintable(type(x).__name__)
+
+
+@update_digest.register
+def _(x: SimpleColumn, h: blake2b) -> None:
+    if x.dtype is None:
+        raise Unfingerprintable("SimpleColumn")
+
+    h.update(x.dtype.__name__.encode())
+    h.update(x.buffer.tobytes())
+    if x.valid is not None:
+        h.update(x.valid.tobytes())
+
+
+@update_digest.register
+def _(x: PlSeries, h: blake2b) -> None:
+    _update_polars({"": x}, h)
+
+
+def _update_polars(columns: dict[str, PlSeries], h: blake2b) -> None:
+    # columns are hashed a frame at a time, since each call to polars has an overhead that
+    # adds up for wide tables
+    import polars as pl
+
+    h.update(repr([str(col.dtype) for col in columns.values()]).encode())
+    try:
+        row_hashes = pl.DataFrame(columns).hash_rows(seed=0)
+    except Exception:
+        # e.g. object columns
+        raise Unfingerprintable("polars")
+
+    h.update(row_hashes.to_numpy().tobytes())
+
+
+@update_digest.register
+def _(x: PdSeries, h: blake2b) -> None:
+    import pandas as pd
+
+    h.update(str(x.dtype).encode())
+    if isinstance(x.array, pd.arrays.ArrowExtensionArray):
+        # e.g. strings, which are stored by arrow. Their buffers are hashed directly, since
+        # pandas hashes arrow strings a value at a time.
+        for chunk in x.array.__arrow_array__().chunks:
+            h.update(f"{chunk.offset}:{len(chunk)};".encode())
+            for buffer in chunk.buffers():
+                h.update(buffer if buffer is not None else b"-")
+    elif isinstance(x.dtype, pd.CategoricalDtype):
+        # categories are hashed as values, since pandas hashes objects by their strings
+        # (so 1 and "1" would match). There are usually few categories.
+        h.update(x.cat.codes.to_numpy().tobytes())
+        _update_values(x.cat.categories.tolist(), h)
+    elif x.dtype.kind == "O":
+        # e.g. object columns
+        raise Unfingerprintable(str(x.dtype))
+    else:
+        h.update(pd.util.hash_pandas_object(x, index=False).to_numpy().tobytes())
+
+
+def fingerprint(data: ColumnStore, config: dict[str, Any]) -> str | None:
+    """Return a fingerprint for a table, from its data and (json serializable) config.
+
+    Returns None if the table's data is slower to hash than to convert to props, so its props
+    shouldn't be cached.
+    """
+    h = blake2b(digest_size=16)
+    columns = {name: data.get_column(name) for name in data}
+    h.update(repr([(name, len(col)) for name, col in columns.items()]).encode())
+    try:
+        polars_columns = {k: col for k, col in columns.items() if isinstance(col, PlSeries)}
+        if polars_columns:
+            _update_polars(polars_columns, h)
+
+        for name, col in columns.items():
+            if name not in polars_columns:
+                h.update(name.encode())
+                update_digest(col, h)
+    except Unfingerprintable:
+        return None
+
+    h.update(json.dumps(config, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+# payload size --------------------------------------------------------
+
+
+def payload_size(x: Any) -> int:
+    """Estimate the size in bytes of serialized props."""
+    if isinstance(x, (memoryview, bytes, bytearray)):
+        return memoryview(x).nbytes
+    elif isinstance(x, str):
+        return len(x) + 2
+    elif isinstance(x, dict):
+        return sum(len(str(k)) + 3 + payload_size(v) for k, v in x.items()) + 2
+    elif isinstance(x, (list, tuple)):
+        # most values are scalars, so they are sized without a call per value
+        size = 2
+        for v in x:
+            if isinstance(v, str):
+                size += len(v) + 3
+            elif isinstance(v, (dict, list, tuple, memoryview, bytes, bytearray)):
+                size += payload_size(v) + 1
+            else:
+                size += 9
+
+        return size
+
+    # numbers, bools, and None
+    return 8
+
+
+# cache ---------------------------------------------------------------
+
+
+@dataclass
+class CacheEntry:
+    props: dict[str, Any]
+    size: int
+
+    # widgets hold their table's data, so are only weakly referenced. Otherwise the cache
+    # would keep data alive that isn't counted in its size.
+    _widget: weakref.ref[ReactableWidget] | None = field(default=None, repr=False)
+
+    @property
+    def widget(self) -> ReactableWidget | None:
+        """The last widget created from the props, while it is still in use."""
+        return self._widget() if self._widget is not None else None
+
+    @widget.setter
+    def widget(self, widget: ReactableWidget | None) -> None:
+        self._widget = weakref.ref(widget) if widget is not None else None
+
+
+class PropsCache:
+    """A least recently used cache of table props, which evicts entries by total size.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum total (estimated) size in bytes of the cached props. Entries larger
+        than this are not cached.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key: str, props: dict[str, Any], size: int | None = None) -> CacheEntry:
+        """Add props to the cache. Their size is estimated from the props, unless given."""
+        entry = CacheEntry(props, payload_size(props) if size is None else size)
+        if entry.size > self.max_size:
+            return entry
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= old.size
+
+        self._entries[key] = entry
+        self.size += entry.size
+
+        while self.size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+_caches: dict[str, PropsCache] = {}
+
+
+def get_props_cache(max_size: int, name: str = "props") -> PropsCache:
+    """Return one of the kernel's caches, by name. Changing max_size clears the cache.
+
+    Caches are kept for table props ("props"), and formatted great_tables cells ("gt_cells").
+    """
+    cache = _caches.setdefault(name, PropsCache(0))
+    if cache.max_size != max_size:
+        cache.max_size = max_size
+        cache.clear()
+
+    return cache
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+from ._tbl_data import ColumnLike, DataFrameLike, to_columns, to_list
+from ._profile import measure, record_payload
+
+
+class ColumnStore(Mapping):
+    """The columns of a table, kept in their backend's native format.
+
+    Columns are only converted to python values when they are needed. Indexing the store
+    returns a column's values as a list (e.g. for passing to python callbacks), while
+    `get_column()` returns the native column (e.g. a polars or pandas Series).
+
+    Parameters
+    ----------
+    columns:
+        A mapping of column name to column. Columns may be lists, or any column type
+        supported by the table data backends.
+    """
+
+    def __init__(self, columns: dict[str, ColumnLike | list[Any]]):
+        self._columns = dict(columns)
+
+    @classmethod
+    def from_frame(cls, data: DataFrameLike) -> ColumnStore:
+        return cls(to_columns(data))
+
+    def __getitem__(self, k: str) -> list[Any]:
+        return to_list(self._columns[k])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._columns)})"
+
+    @property
+    def n_rows(self) -> int:
+        return len(next(iter(self._columns.values()), []))
+
+    def get_column(self, k: str) -> ColumnLike | list[Any]:
+        """Return a column in its native format."""
+        return self._columns[k]
+
+    def insert(self, k: str, col: ColumnLike | list[Any], first: bool = False) -> ColumnStore:
+        """Return a new store with a column added (at the start, if first is True)."""
+        if first:
+            return self.__class__({k: col, **self._columns})
+
+        return self.__class__({**self._columns, k: col})
+
+    # updates ----
+    # these return new stores, whose updated columns are python lists
+
+    def take(self, rows: list[int]) -> ColumnStore:
+        """Return a new store with only the given rows, in the given order."""
+        return self.__class__({k: [vals[ii] for ii in rows] for k, vals in self.items()})
+
+    def patch(self, updates: dict[str, dict[int, Any]]) -> ColumnStore:
+        """Return a new store with cells replaced, as a mapping of column to {row: value}."""
+        unknown = set(updates) - set(self._columns)
+        if unknown:
+            raise KeyError(f"Cannot patch columns not in the data: {sorted(unknown)}")
+
+        columns = dict(self._columns)
+        for k, cells in updates.items():
+            col = list(self[k])
+            for ii, val in cells.items():
+                col[ii] = val
+
+            columns[k] = col
+
+        return self.__class__(columns)
+
+    def concat(self, other: ColumnStore) -> ColumnStore:
+        """Return a new store, with the rows of other added to the end."""
+        if set(other) != set(self._columns):
+            raise ValueError(
+                "Rows to add must have the same columns as the data. "
+                f"Data has {list(self._columns)}, rows have {list(other)}"
+            )
+
+        return self.__class__({k: [*self[k], *other[k]] for k in self._columns})
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        return {k: to_list(col) for k, col in self._columns.items()}
+
+    def to_props(self):
+        out = {}
+        for name, col in self._columns.items():
+            with measure("encode", column=name):
+                out[name] = to_list(col)
+                record_payload(out[name])
+
+        return out
+
+
+def check_row_keys(keys: list[Any], row_key: str) -> None:
+    """Raise a ValueError if the values of a row_key column aren't unique."""
+    if len(set(keys)) == len(keys):
+        return
+
+    seen = set()
+    duplicates = {key for key in keys if key in seen or seen.add(key)}
+    raise ValueError(
+        f"Values of the row_key column {row_key!r} must be unique, but some are repeated: "
+        f"{sorted(duplicates, key=repr)[:10]}"
+    )
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import io
+import re
+
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import htmltools
+
+from ._profile import measure
+from ._serialize import dumps, iter_dumps
+
+# id of the script element the bundle is embedded in, for single file pages
+BUNDLE_ID = "reactable-bundle"
+
+
+def _version() -> str:
+    from importlib_metadata import PackageNotFoundError, version
+
+    try:
+        return version("reactable")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+def html_dependency() -> htmltools.HTMLDependency:
+    """The javascript and css for rendering tables outside of a notebook.
+
+    htmltools includes a dependency once per page, no matter how many tables use it.
+    """
+    return htmltools.HTMLDependency(
+        "reactable",
+        _version(),
+        source={"package": "reactable", "subdir": "static"},
+        script={"src": "reactable-html.js"},
+        stylesheet={"href": "reactable-py.esm.css"},
+        # the loader imports the bundle from the same directory
+        all_files=True,
+    )
+
+
+def _escape_script(text: str) -> str:
+    # a closing script tag inside a script element would end it early. Note that
+    # "<\/" is equivalent to "</" inside javascript (and json) strings.
+    return re.sub(r"</(script)", r"<\\/\1", text, flags=re.IGNORECASE)
+
+
+def encode_props(props: dict[str, Any], compress: bool = True) -> str:
+    """Serialize table props for a script element, optionally gzip compressed (as base64)."""
+    with measure("serialize"):
+        if not compress:
+            return _escape_script(dumps(props).decode())
+
+        # json is compressed as it's written, so the uncompressed text is never held in full
+        out = io.BytesIO()
+        with gzip.GzipFile(fileobj=out, mode="wb", mtime=0) as f:
+            for chunk in iter_dumps(props):
+                f.write(chunk)
+
+        return base64.b64encode(out.getvalue()).decode()
+
+
+def table_tags(props: dict[str, Any], compress: bool = True) -> htmltools.TagList:
+    """Create the html for a table, along with the dependency that renders it."""
+    el_id = f"reactable-{uuid4().hex[:12]}"
+    props_id = f"{el_id}-props"
+
+    return htmltools.TagList(
+        html_dependency(),
+        htmltools.tags.div(id=el_id, data_reactable_props=props_id),
+        htmltools.tags.script(
+            htmltools.HTML(encode_props(props, compress)),
+            type="application/json",
+            id=props_id,
+            data_encoding="gzip+base64" if compress else None,
+        ),
+    )
+
+
+# single file pages ----
+
+
+def _inline_dependency(dep: htmltools.HTMLDependency) -> list[htmltools.Tag]:
+    source = Path(dep.source_path_map()["source"])
+
+    out = []
+    for sheet in dep.stylesheet:
+        css = (source / sheet["href"]).read_text()
+        out.append(htmltools.tags.style(htmltools.HTML(css)))
+
+    if dep.name == "reactable":
+        # embedded once, and loaded by reactable-html.js as a module
+        bundle = (source / "reactable-py.esm.js").read_text()
+        out.append(
+            htmltools.tags.script(
+                htmltools.HTML(_escape_script(bundle)), type="text/plain", id=BUNDLE_ID
+            )
+        )
+
+    for script in dep.script:
+        js = (source / script["src"]).read_text()
+        attrs = {k: v for k, v in script.items() if k != "src"}
+        out.append(htmltools.tags.script(htmltools.HTML(_escape_script(js)), **attrs))
+
+    if dep.head is not None:
+        out.append(dep.head)
+
+    return out
+
+
+def to_html(*content: htmltools.TagChild, path: str | Path | None = None, title: str = "") -> str:
+    """Render tables (and other html content) as a single file html page.
+
+    The reactable javascript and css are embedded once in the page, no matter how many
+    tables it contains. Table data is gzip compressed.
+
+    Note that the page isn't fully self-contained: React is loaded from esm.sh, so viewing
+    the page needs network access.
+
+    Parameters
+    ----------
+    *content:
+        Tables, or any other content supported by htmltools, such as tags.
+    path:
+        A file to save the page to.
+    title:
+        The title of the page.
+
+    Returns
+    -------
+    :
+        The html of the page.
+    """
+    rendered = htmltools.TagList(*content).render()
+
+    head = [htmltools.tags.meta(charset="utf-8")]
+    if title:
+        head.append(htmltools.tags.title(title))
+
+    for dep in rendered["dependencies"]:
+        head.extend(_inline_dependency(dep))
+
+    page = htmltools.TagList(
+        htmltools.HTML("<!DOCTYPE html>"),
+        htmltools.tags.html(
+            htmltools.tags.head(*head),
+            htmltools.tags.body(htmltools.HTML(rendered["html"])),
+        ),
+    )
+    html = str(page)
+
+    if path is not None:
+        Path(path).write_text(html, encoding="utf-8")
+
+    return html
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator
+
+from ._cache import payload_size
+
+
+@dataclass
+class PhaseRecord:
+    """Measurements for one phase of building a table.
+
+    Attributes
+    ----------
+    phase:
+        The name of the phase (e.g. "init_data" or "encode").
+    column:
+        The id of the column the phase ran for, if it ran per column.
+    seconds:
+        Wall time spent in the phase.
+    allocated:
+        Bytes allocated during the phase that were still in use at its end. None unless
+        tracemalloc was tracing.
+    peak_memory:
+        The most bytes in use during the phase, above the amount at its start. None unless
+        tracemalloc was tracing.
+    payload_bytes:
+        The estimated size of the props the phase produced, for serialization phases.
+    """
+
+    phase: str
+    column: str | None = None
+    seconds: float = 0.0
+    allocated: int | None = None
+    peak_memory: int | None = None
+    payload_bytes: int | None = None
+
+    def _add(self, other: PhaseRecord) -> None:
+        self.seconds += other.seconds
+        self.allocated = _add_optional(self.allocated, other.allocated)
+        self.payload_bytes = _add_optional(self.payload_bytes, other.payload_bytes)
+        if other.peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, other.peak_memory)
+
+
+def _add_optional(x: int | None, y: int | None) -> int | None:
+    return y if x is None else x if y is None else x + y
+
+
+@dataclass
+class ProfileReport:
+    """Phases recorded while building tables, in the order they finished.
+
+    Phases may be nested. For example, each column's "init_data" phase runs within the
+    table's "columns" phase.
+    """
+
+    records: list[PhaseRecord] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[PhaseRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _totals(self, key: Callable[[PhaseRecord], Any]) -> dict[Any, PhaseRecord]:
+        out: dict[Any, PhaseRecord] = {}
+        for record in self.records:
+            k = key(record)
+            if k not in out:
+                out[k] = PhaseRecord(phase=record.phase, column=record.column)
+
+            out[k]._add(record)
+
+        return out
+
+    def by_phase(self) -> dict[str, PhaseRecord]:
+        """Return totals for each phase, summed over columns."""
+        totals = self._totals(lambda record: record.phase)
+        for record in totals.values():
+            record.column = None
+
+        return totals
+
+    def by_column(self) -> dict[str, PhaseRecord]:
+        """Return totals for each column, summed over its phases."""
+        totals = self._totals(lambda record: record.column)
+        totals.pop(None, None)
+        for record in totals.values():
+            record.phase = "*"
+
+        return totals
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Return records as dictionaries, e.g. for creating a DataFrame."""
+        return [asdict(record) for record in self.records]
+
+    def __str__(self) -> str:
+        header = f"{'phase':<16} {'seconds':>9} {'peak memory':>12} {'payload bytes':>14}"
+        lines = [header, "-" * len(header)]
+        for name, record in self.by_phase().items():
+            lines.append(
+                f"{name:<16} {record.seconds:>9.4f} {_fmt(record.peak_memory):>12}"
+                f" {_fmt(record.payload_bytes):>14}"
+            )
+
+        return "\n".join(lines)
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+
+def _fmt(x: int | None) -> str:
+    return "" if x is None else f"{x:,}"
+
+
+# recording phases ----------------------------------------------------
+
+
+@dataclass
+class _OpenPhase:
+    record: PhaseRecord
+    start: float
+    start_overhead: float
+    payloads: list[Any] = field(default_factory=list)
+    start_memory: int = 0
+    peak: int = 0
+
+
+class Profiler:
+    """Record phases, passing each finished phase to a hook.
+
+    Memory is only measured while tracemalloc is tracing. Payload sizes are measured as
+    each phase ends, and the time spent measuring them is left out of enclosing phases.
+    """
+
+    def __init__(self, hook: Callable[[PhaseRecord], None]):
+        self.hook = hook
+        self._stack: list[_OpenPhase] = []
+        self._overhead = 0.0
+
+    @contextmanager
+    def measure(self, phase: str, column: str | None = None) -> Iterator[PhaseRecord]:
+        tracing = tracemalloc.is_tracing()
+        current = PhaseRecord(phase, column)
+        open_phase = _OpenPhase(current, time.perf_counter(), self._overhead)
+
+        if tracing:
+            # peaks are tracked per phase, so the enclosing phase keeps its peak so far
+            mem, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            open_phase.start_memory = open_phase.peak = mem
+
+        self._stack.append(open_phase)
+        try:
+            yield current
+        finally:
+            self._stack.pop()
+            end = time.perf_counter()
+            current.seconds = end - open_phase.start - (self._overhead - open_phase.start_overhead)
+
+            if tracing and tracemalloc.is_tracing():
+                mem, peak = tracemalloc.get_traced_memory()
+                peak = max(open_phase.peak, peak)
+                current.allocated = mem - open_phase.start_memory
+                current.peak_memory = peak - open_phase.start_memory
+                if self._stack:
+                    self._stack[-1].peak = max(self._stack[-1].peak, peak)
+
+            if open_phase.payloads:
+                current.payload_bytes = sum(map(payload_size, open_phase.payloads))
+                self._overhead += time.perf_counter() - end
+
+            self.hook(current)
+
+    def record_payload(self, x: Any) -> None:
+        if self._stack:
+            self._stack[-1].payloads.append(x)
+
+
+_active: ContextVar[Profiler | None] = ContextVar("reactable_profiler", default=None)
+
+# a profiler for options.instrument, re-used while the hook is the same
+_hook_profiler: Profiler | None = None
+
+
+def _current() -> Profiler | None:
+    global _hook_profiler
+
+    profiler = _active.get()
+    if profiler is not None:
+        return profiler
+
+    from .options import options
+
+    if options.instrument is None:
+        return None
+    elif _hook_profiler is None or _hook_profiler.hook is not options.instrument:
+        _hook_profiler = Profiler(options.instrument)
+
+    return _hook_profiler
+
+
+@contextmanager
+def measure(phase: str, column: str | None = None) -> Iterator[None]:
+    """Record a phase of building a table, when profiling or instrumented."""
+    profiler = _current()
+    if profiler is None:
+        yield
+        return
+
+    with profiler.measure(phase, column):
+        yield
+
+
+def record_payload(x: Any) -> None:
+    """Add the size of serialized props to the innermost phase, when profiling."""
+    profiler = _current()
+    if profiler is not None:
+        profiler.record_payload(x)
+
+
+@contextmanager
+def profile(memory: bool = True) -> Iterator[ProfileReport]:
+    """Record the time, memory, and payload size of each phase of building tables.
+
+    Phases include creating default columns, converting data, running python callbacks for
+    each column and row, and serializing data for each column. Tables built (or converted
+    to props) inside the block are recorded in the yielded report.
+
+    Parameters
+    ----------
+    memory:
+        Whether to measure memory, using tracemalloc. This slows down building tables.
+
+    Examples
+    --------
+
+    ```{python}
+    import reactable as rt
+    from reactable.data import cars_93
+
+    with rt.profile() as report:
+        rt.Reactable(cars_93).to_props()
+
+    print(report)
+    ```
+    """
+    report = ProfileReport()
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    token = _active.set(Profiler(report.records.append))
+    try:
+        yield report
+    finally:
+        _active.reset(token)
+        if started:
+            tracemalloc.stop()
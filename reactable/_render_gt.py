@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import functools
+import sys
+import sysconfig
 import htmltools as html
 
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from hashlib import blake2b
+from types import CodeType, FunctionType, MethodType, ModuleType
+
 from great_tables import GT
 from great_tables._tbl_data import n_rows
 from great_tables._helpers import random_id
@@ -9,9 +17,11 @@ from great_tables._text import _process_text
 from great_tables._gt_data import ColInfoTypeEnum
 from typing import TYPE_CHECKING, Any
 
-from .models import Column, Language, Theme, ColGroup
+from .models import Column, Language, Theme, ColGroup, get_options
 from . import Reactable
-from ._tbl_data import subset_frame, to_dict
+from ._cache import Unfingerprintable, get_props_cache, update_digest
+from ._profile import measure
+from ._tbl_data import PdDataFrame, PlDataFrame, subset_frame, to_columns, to_dict, to_list
 
 if TYPE_CHECKING:
     from great_tables._gt_data import Locale, Spanners, Heading, Footnotes, SourceNotes, Options
@@ -124,28 +134,228 @@ def create_footer(
     return html.tags.tfoot(create_tr(combined_notes), class_="gt_sourcenotes")
 
 
+# fingerprints ----
+# Formatting every cell is the slowest part of rendering a GT, and apps often re-render
+# tables whose cells haven't changed (e.g. rebuilding the same GT on every input change).
+# So formatted cells are cached, keyed by a fingerprint of the GT's data, formats, styles,
+# and anything else that may affect them. Formats are functions (often partials holding
+# an earlier copy of the GT), so they're fingerprinted by their code, the values they
+# close over, and the globals they read.
+
+# parts of a GT that don't affect its cells, so changing them re-uses formatted cells
+_CELL_INDEPENDENT_FIELDS = {
+    "_heading",
+    "_spanners",
+    "_stubhead",
+    "_source_notes",
+    "_footnotes",
+    "_has_built",
+}
+
+
+_PLAIN_TYPES = {str, int, float, bool, type(None)}
+
+
+class _Unfingerprintable(Exception):
+    """Raised for values that can't be told apart from their contents (e.g. by their repr)."""
+
+
+class _GTDigest:
+    def __init__(self):
+        self.h = blake2b(digest_size=16)
+
+        # objects are often shared (e.g. the data of each copy of a GT held by formats),
+        # so each is hashed once, and referred to by position after that. Objects are kept
+        # alive until hashing is done, so their ids can't be re-used by other objects.
+        self._seen: dict[int, tuple[int, Any]] = {}
+
+    def _update_seen(self, x: Any) -> bool:
+        if id(x) in self._seen:
+            self.h.update(f"@{self._seen[id(x)][0]};".encode())
+            return True
+
+        self._seen[id(x)] = (len(self._seen), x)
+        return False
+
+    def update_all(self, *args: Any) -> None:
+        for x in args:
+            self.update(x)
+
+    def update(self, x: Any) -> None:
+        h = self.h
+
+        if x is None or isinstance(x, (bool, int, float, str, bytes, Enum)):
+            h.update(f"{type(x).__name__}:{x!r};".encode())
+        elif isinstance(x, (PdDataFrame, PlDataFrame)):
+            if not self._update_seen(x):
+                for name, col in to_columns(x).items():
+                    h.update(f"col:{name!r};".encode())
+                    try:
+                        update_digest(col, h)
+                    except Unfingerprintable:
+                        # formatting cells is slower than hashing python objects
+                        self._update_items(to_list(col))
+        elif isinstance(x, (list, tuple)):
+            if not self._update_seen(x):
+                h.update(f"{type(x).__name__}[".encode())
+                self._update_items(x)
+                h.update(b"]")
+        elif isinstance(x, dict):
+            h.update(b"{")
+            for k, v in x.items():
+                self.update(k)
+                self.update(v)
+            h.update(b"}")
+        elif isinstance(x, functools.partial):
+            h.update(b"partial:")
+            self.update_all(x.func, x.args, x.keywords)
+        elif isinstance(x, MethodType):
+            h.update(b"method:")
+            self.update_all(x.__func__, x.__self__)
+        elif isinstance(x, FunctionType):
+            # functions can refer to themselves (e.g. recursive functions), through globals
+            if self._update_seen(x):
+                return
+
+            closure = [cell.cell_contents for cell in x.__closure__ or []]
+            h.update(f"function:{x.__module__}.{x.__qualname__};".encode())
+            self.update_all(x.__code__, x.__defaults__, x.__kwdefaults__, closure)
+
+            # functions can read module globals, which may change between calls
+            for name in _global_names(x.__code__):
+                if name in x.__globals__:
+                    self.update(name)
+                    self._update_global(x.__globals__[name])
+        elif isinstance(x, CodeType):
+            h.update(x.co_code)
+            self.update_all(x.co_consts, x.co_names)
+        elif hasattr(x, "__dict__"):
+            # e.g. dataclasses, like the GT's formats and styles
+            if not self._update_seen(x):
+                h.update(f"{type(x).__module__}.{type(x).__qualname__}:".encode())
+                self.update(vars(x))
+        else:
+            text = repr(x)
+            if " at 0x" in text:
+                raise _Unfingerprintable(text)
+
+            h.update(f"{type(x).__qualname__}:{text};".encode())
+
+    def _update_global(self, x: Any) -> None:
+        # modules, classes, and library functions are hashed by name (e.g. to skip the caches
+        # they hold). Other functions follow the globals they read too, and callable
+        # instances are hashed by their attributes, like any other value.
+        if isinstance(x, ModuleType):
+            self.h.update(f"module:{x.__name__};".encode())
+        elif isinstance(x, type):
+            self.h.update(f"class:{x.__module__}.{x.__qualname__};".encode())
+        elif isinstance(x, FunctionType) and _is_library_module(x.__module__):
+            self.h.update(f"function:{x.__module__}.{x.__qualname__};".encode())
+            self.update(x.__code__)
+        else:
+            self.update(x)
+
+    def _update_items(self, x: list[Any] | tuple[Any, ...]) -> None:
+        # lists can have an item per row (e.g. the rows of a stub, or rows a format applies
+        # to), so common cases are hashed without a call per item
+        types = set(map(type, x))
+        if types <= _PLAIN_TYPES:
+            self.h.update(repr(x).encode())
+        elif len(types) == 1 and _is_plain_dataclass(x[0]):
+            # hashed a field at a time, as columns of values
+            for field in fields(x[0]):
+                self.update(field.name)
+                self._update_items([getattr(item, field.name) for item in x])
+        else:
+            for item in x:
+                self.update(item)
+
+
+def _global_names(code: CodeType) -> list[str]:
+    """Return the names a function's code reads, including in nested functions."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names.extend(_global_names(const))
+
+    return sorted(set(names))
+
+
+@functools.lru_cache(maxsize=None)
+def _is_library_module(name: str | None) -> bool:
+    """Return whether a module is installed (e.g. the standard library, or site-packages)."""
+    file = getattr(sys.modules.get(name), "__file__", None)
+    if file is None:
+        # e.g. __main__ in notebooks has no file, but builtin modules don't either
+        return name in sys.builtin_module_names
+
+    paths = sysconfig.get_paths()
+    return any(
+        file.startswith(paths[key]) for key in ["stdlib", "platstdlib", "purelib", "platlib"]
+    )
+
+
+def _is_plain_dataclass(x: Any) -> bool:
+    # dataclasses with attributes that aren't fields can't be hashed by their fields
+    return is_dataclass(x) and set(getattr(x, "__dict__", ())) <= {f.name for f in fields(x)}
+
+
+def gt_fingerprint(self: GT) -> str | None:
+    """Return a fingerprint of everything about a GT that affects its formatted cells.
+
+    Returns None if part of the GT can't be fingerprinted, so its cells shouldn't be cached.
+    """
+    digest = _GTDigest()
+    try:
+        for name, value in vars(self).items():
+            if name not in _CELL_INDEPENDENT_FIELDS:
+                digest.update_all(name, value)
+    except _Unfingerprintable:
+        return None
+
+    return digest.h.hexdigest()
+
+
 def extract_cells(
     self: GT, columns: str | list[str], rows: int | list[int] | None = None, output: str = "html"
-) -> list[str]:
+) -> dict[str, list[str]]:
+    if rows is not None:
+        raise NotImplementedError()
+
+    if isinstance(columns, str):
+        columns = [columns]
+
+    cache = get_props_cache(get_options().cache_size, "gt_cells")
+    if not cache.max_size:
+        return _format_cells(self, columns, output)
+
+    fingerprint = gt_fingerprint(self)
+    if fingerprint is None:
+        return _format_cells(self, columns, output)
+
+    key = f"{fingerprint}:{output}:{columns!r}"
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache.put(key, _format_cells(self, columns, output))
+
+    return entry.props
+
+
+def _format_cells(self: GT, columns: list[str], output: str) -> dict[str, list[str]]:
     from great_tables._tbl_data import (
         cast_frame_to_string,
         replace_null_frame,
     )
 
-    if rows is not None:
-        raise NotImplementedError()
-
     # format ----
-    new_gt = self._build_data(output)
+    with measure("gt_format"):
+        new_gt = self._build_data(output)
 
     # TODO: are these actions done in GT render_body_h, is this a general activity?
     _str_orig_data = cast_frame_to_string(new_gt._tbl_data)
     df_stringified = replace_null_frame(new_gt._body.body, _str_orig_data)
 
     # extract specific columns ----
-    if isinstance(columns, str):
-        columns = [columns]
-
     # TODO: get_cell gets individual cell, need one that gets columns
     df_subset = subset_frame(df_stringified, cols=columns)
     return to_dict(df_subset)
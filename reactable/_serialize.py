@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import math
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Literal
+
+from typing_extensions import TypeAlias
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Props are serialized to compact json, with these types written natively:
+#
+#   * numpy scalars and arrays: as their python values (numpy datetimes as ISO strings).
+#   * Decimal: as numbers. Integral values keep all their digits, others are written as the
+#     nearest double, which is what the browser parses any json number as.
+#   * datetime, date, and time: as ISO 8601 strings, including any UTC offset.
+#   * timedelta: as strings, e.g. "1 day, 2:00:00".
+#   * NaN, infinity, and missing values (e.g. pandas NaT and NA): as null.
+#
+# orjson is used when it's installed, and otherwise the standard library's json module.
+# Both produce the same output.
+
+Backend: TypeAlias = Literal["orjson", "json"]
+
+BACKEND: Backend = "json" if orjson is None else "orjson"
+
+# lists longer than this are written a chunk at a time, when streaming
+CHUNK_SIZE = 10_000
+
+_PLAIN_TYPES = {str, int, float, bool, type(None)}
+_BUFFER_TYPES = (memoryview, bytes, bytearray)
+
+
+def _default(x: Any) -> Any:
+    """Convert a value json can't write into one that it can."""
+    type_ = type(x)
+    if type_.__name__ in {"NaTType", "NAType"}:
+        # pandas missing values (NaT is also a datetime)
+        return None
+    elif isinstance(x, Decimal):
+        if not x.is_finite():
+            return None
+        return int(x) if x == x.to_integral_value() else float(x)
+    elif isinstance(x, (datetime, date, time)):
+        # includes pandas Timestamps
+        return x.isoformat()
+    elif isinstance(x, timedelta):
+        # pandas Timedeltas are written like python ones, so every backend matches
+        return str(timedelta(x.days, x.seconds, x.microseconds))
+
+    if type_.__module__ == "numpy":
+        if type_.__name__ in {"datetime64", "timedelta64"}:
+            return None if x != x else str(x)
+        elif hasattr(x, "tolist"):
+            return x.tolist()
+
+    raise TypeError(f"Object of type {type_.__name__} is not JSON serializable")
+
+
+def _finite(x: Any) -> Any:
+    """Replace NaN and infinity with None, which json writes as null."""
+    if isinstance(x, float):
+        return x if math.isfinite(x) else None
+    elif isinstance(x, dict):
+        return {k: _finite(v) for k, v in x.items()}
+    elif isinstance(x, (list, tuple)):
+        return [_finite(v) for v in x]
+    elif type(x) in _PLAIN_TYPES:
+        return x
+
+    converted = _default(x)
+    return converted if converted is None or type(converted) is str else _finite(converted)
+
+
+_json_encoder = json.JSONEncoder(default=_default, allow_nan=False, separators=(",", ":"))
+
+
+def _dumps_json(x: Any) -> bytes:
+    try:
+        return _json_encoder.encode(x).encode()
+    except ValueError:
+        # NaN or infinity, which the encoder can't write as null
+        return _json_encoder.encode(_finite(x)).encode()
+
+
+def _dumps_orjson(x: Any) -> bytes:
+    try:
+        return orjson.dumps(
+            x, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        # orjson can't write some values that json can (e.g. integers over 64 bits)
+        return _dumps_json(x)
+
+
+def _encoder(backend: Backend | None) -> Callable[[Any], bytes]:
+    backend = BACKEND if backend is None else backend
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError("The orjson backend requires the orjson package.")
+        return _dumps_orjson
+    elif backend == "json":
+        return _dumps_json
+
+    raise ValueError(f"Unknown backend: {backend!r}. Use 'orjson' or 'json'.")
+
+
+def dumps(x: Any, backend: Backend | None = None) -> bytes:
+    """Serialize props to json, as utf-8 encoded bytes."""
+    return _encoder(backend)(x)
+
+
+def iter_dumps(
+    x: Any, chunk_size: int = CHUNK_SIZE, backend: Backend | None = None
+) -> Iterator[bytes | memoryview]:
+    """Serialize props to json a piece at a time, e.g. for writing to a file.
+
+    Dictionaries are written a value at a time, and long lists (like the columns of a
+    table's data) a chunk of values at a time, so the full json is never held in memory.
+    Joining the pieces gives the same output as `dumps()`.
+    """
+    encode = _encoder(backend)
+    yield from _iter_dumps(x, chunk_size, encode)
+
+
+def _iter_dumps(x: Any, chunk_size: int, encode: Callable[[Any], bytes]) -> Iterator[Any]:
+    if isinstance(x, dict):
+        for ii, (k, v) in enumerate(x.items()):
+            # keys are encoded as an item, so they're converted to strings in the same way
+            # (e.g. b'{"k":null}' -> b'{"k":')
+            key = encode({k: None})[:-5]
+            yield key if ii == 0 else b"," + key[1:]
+            yield from _iter_dumps(v, chunk_size, encode)
+        yield b"}" if x else b"{}"
+    elif isinstance(x, list) and len(x) > chunk_size:
+        yield b"["
+        for start in range(0, len(x), chunk_size):
+            if start:
+                yield b","
+            # drop the brackets around each chunk, without copying it
+            yield memoryview(encode(x[start : start + chunk_size]))[1:-1]
+        yield b"]"
+    else:
+        yield encode(x)
+
+
+# widgets -------------------------------------------------------------
+
+
+def to_jsonable(x: Any) -> Any:
+    """Convert props to plain python values, for sending to a widget.
+
+    Widget state is serialized by the kernel, which only handles plain python values, and
+    splits binary buffers (e.g. memoryviews) out of the state. So buffers are kept as is,
+    lists of plain values are returned without copying, and other values are converted
+    like `dumps()` writes them (e.g. NaN to None, and Decimals to numbers).
+    """
+    type_ = type(x)
+    if type_ in _PLAIN_TYPES:
+        return None if type_ is float and not math.isfinite(x) else x
+    elif isinstance(x, _BUFFER_TYPES):
+        return x
+    elif isinstance(x, dict):
+        return {k: to_jsonable(v) for k, v in x.items()}
+    elif isinstance(x, (list, tuple)):
+        types = set(map(type, x))
+        if types <= _PLAIN_TYPES and (
+            float not in types or all(math.isfinite(v) for v in x if type(v) is float)
+        ):
+            return x if type_ is list else list(x)
+        return [to_jsonable(v) for v in x]
+
+    converted = _default(x)
+    return converted if converted is None or type(converted) is str else to_jsonable(converted)
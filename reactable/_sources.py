@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from ._tbl_data import DataFrameLike, WidgetColTypes, to_columns, to_list
+from .simpleframe import SimpleFrame
+
+# rows are fetched at least this many at a time, to limit round trips (e.g. to a database)
+FETCH_SIZE = 100
+
+
+class DataSource(ABC):
+    """Rows that are fetched from a source in batches, such as a database cursor.
+
+    Tables read every row of a source when they are created. Fetched rows are kept, so each
+    row is only pulled from the source once.
+    """
+
+    def __init__(self):
+        self.exhausted = False
+        self._columns: dict[str, list[Any]] | None = None
+
+    @abstractmethod
+    def _fetch(self, n: int) -> dict[str, list[Any]]:
+        """Return up to n more rows, as columns. Fewer than n rows means there are no more."""
+
+    @property
+    def n_fetched(self) -> int:
+        return _n_rows(self._columns) if self._columns else 0
+
+    def fetch_to(self, stop: int | None = None) -> dict[str, list[Any]]:
+        """Fetch rows up to stop (or every row, if stop is None), and return all fetched rows."""
+        while not self.exhausted and (stop is None or self.n_fetched < stop):
+            if stop is None:
+                # fetch more rows each time, so reading a whole source takes few round trips
+                n = max(self.n_fetched, FETCH_SIZE)
+            else:
+                n = max(stop - self.n_fetched, FETCH_SIZE)
+            chunk = self._fetch(n)
+
+            if self._columns is None:
+                self._columns = chunk
+            else:
+                for name, col in self._columns.items():
+                    col.extend(chunk.get(name, [None] * _n_rows(chunk)))
+
+            if _n_rows(chunk) < n:
+                self.exhausted = True
+
+        return self._columns or {}
+
+    def to_frame(self, stop: int | None = None) -> SimpleFrame:
+        """Return fetched rows up to stop as a SimpleFrame, fetching more if needed."""
+        columns = self.fetch_to(stop)
+        return SimpleFrame({k: col[:stop] for k, col in columns.items()})
+
+    def column_types(self) -> dict[str, WidgetColTypes]:
+        """Return known column types, e.g. from a database schema.
+
+        Columns missing from the result have their types inferred from fetched rows.
+        """
+        return {}
+
+
+class CursorSource(DataSource):
+    """Fetch rows from a DB-API cursor, after a query has been executed."""
+
+    def __init__(self, cursor: Any):
+        super().__init__()
+        self.cursor = cursor
+        self.names = [col[0] for col in cursor.description]
+
+    def _fetch(self, n: int) -> dict[str, list[Any]]:
+        rows = self.cursor.fetchmany(n)
+        if not rows:
+            return {name: [] for name in self.names}
+
+        return {name: list(col) for name, col in zip(self.names, zip(*rows))}
+
+
+class IterableSource(DataSource):
+    """Fetch rows from an iterable.
+
+    Items may be rows, as mappings of column name to value (or sequences of values, when
+    columns is given), or batches of rows, as DataFrames or Arrow record batches.
+
+    Parameters
+    ----------
+    items:
+        An iterable of rows or batches of rows.
+    columns:
+        Column names, for rows that are sequences of values.
+    """
+
+    def __init__(self, items: Iterable[Any], columns: list[str] | None = None):
+        super().__init__()
+        self.items = iter(items)
+        self.names = columns
+
+        # rows left over from the last batch
+        self._pending: dict[str, list[Any]] | None = None
+
+    def _batch_columns(self, item: Any) -> dict[str, list[Any]] | None:
+        if isinstance(item, DataFrameLike):
+            return {k: to_list(col) for k, col in to_columns(item).items()}
+        elif hasattr(item, "to_pydict"):
+            # e.g. pyarrow RecordBatch
+            return item.to_pydict()
+
+        return None
+
+    def _row_values(self, row: Any) -> list[Any]:
+        if isinstance(row, Mapping):
+            if self.names is None:
+                self.names = list(row)
+
+            return [row.get(name) for name in self.names]
+
+        if self.names is None:
+            raise ValueError("Rows that are not mappings require column names (columns=...)")
+
+        return list(row)
+
+    def _fetch(self, n: int) -> dict[str, list[Any]]:
+        chunks = [] if self._pending is None else [self._pending]
+        n_rows = sum(map(_n_rows, chunks))
+        self._pending = None
+
+        rows = []
+        while n_rows < n:
+            item = next(self.items, _DONE)
+            if item is _DONE:
+                break
+
+            batch = self._batch_columns(item)
+            if batch is None:
+                rows.append(self._row_values(item))
+                n_rows += 1
+                continue
+
+            if rows:
+                chunks.append(_transpose(self.names, rows))
+                rows = []
+
+            if self.names is None:
+                self.names = list(batch)
+
+            chunks.append(batch)
+            n_rows += _n_rows(batch)
+
+        if rows:
+            chunks.append(_transpose(self.names, rows))
+
+        out = _concat(self.names or [], chunks)
+
+        # batches may hold more rows than requested, so we keep the rest for later
+        if n_rows > n:
+            self._pending = {k: col[n:] for k, col in out.items()}
+            out = {k: col[:n] for k, col in out.items()}
+
+        return out
+
+
+_DONE = object()
+
+
+def _n_rows(columns: dict[str, list[Any]]) -> int:
+    return len(next(iter(columns.values()), []))
+
+
+def _transpose(names: list[str], rows: list[list[Any]]) -> dict[str, list[Any]]:
+    return {name: list(col) for name, col in zip(names, zip(*rows))}
+
+
+def _concat(names: list[str], chunks: list[dict[str, list[Any]]]) -> dict[str, list[Any]]:
+    # columns missing from a chunk are filled with missing values
+    return {
+        name: [val for chunk in chunks for val in chunk.get(name, [None] * _n_rows(chunk))]
+        for name in names
+    }
+
+
+def as_data_source(data: Any) -> DataSource | None:
+    """Return a DataSource for data fetched in batches, or None for data held in memory."""
+    if isinstance(data, DataSource):
+        return data
+    elif hasattr(data, "fetchmany") and hasattr(data, "description"):
+        return CursorSource(data)
+    elif isinstance(data, Iterator) or hasattr(data, "read_next_batch"):
+        # iterators, generators, and arrow record batch readers
+        return IterableSource(data)
+
+    return None
+
+
+def data_source(data: Iterable[Any] | Any, columns: list[str] | None = None) -> DataSource:
+    """Create a source of rows for a table, from a DB-API cursor or an iterable.
+
+    Sources are not paged: every row is read into memory when a table is created from
+    them. Rows are read in batches, so cursors don't fetch all their rows in one call.
+
+    Parameters
+    ----------
+    data:
+        A DB-API cursor (after executing a query), or an iterable of rows or batches of rows.
+        Rows may be mappings of column name to value, or sequences of values (with columns).
+        Batches may be DataFrames, or Arrow record batches.
+    columns:
+        Column names, for rows that are sequences of values.
+
+    Examples
+    --------
+
+    ```{python}
+    from reactable import Reactable, data_source
+
+    rows = ({"x": ii, "y": ii**2} for ii in range(1_000))
+    Reactable(data_source(rows))
+    ```
+    """
+    if hasattr(data, "fetchmany") and hasattr(data, "description"):
+        return CursorSource(data)
+
+    return IterableSource(data, columns=columns)
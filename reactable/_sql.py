@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._sources import CursorSource
+from ._tbl_data import WidgetColTypes, sql_col_type
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqlTable(CursorSource):
+    """A table or query in a sqlite3 or DuckDB database.
+
+    The table or query is run once, and its rows are read from the cursor in batches.
+
+    Parameters
+    ----------
+    con:
+        A sqlite3 or DuckDB connection.
+    table:
+        The name of a table (or view) to show.
+    query:
+        A SELECT query to show. Exactly one of table or query must be given.
+    """
+
+    def __init__(self, con: Any, table: str | None = None, query: str | None = None):
+        if (table is None) == (query is None):
+            raise ValueError("Exactly one of table or query must be specified.")
+
+        self.con = con
+        self.table = table
+        self.query = query
+        self.from_clause = quote_ident(table) if table is not None else f"({query}) AS _q"
+
+        # a cursor of its own, since DuckDB connections only hold the result of their last
+        # query (e.g. reading column types would discard the rows)
+        cursor = con.cursor()
+        cursor.execute(f"SELECT * FROM {self.from_clause}")
+        super().__init__(cursor)
+
+    @property
+    def is_duckdb(self) -> bool:
+        return type(self.con).__module__.startswith("duckdb")
+
+    def execute(self, sql: str, params: list[Any] = ()) -> tuple[list[tuple], list[tuple]]:
+        """Run a query, returning the cursor description and rows."""
+        cur = self.con.execute(sql, list(params))
+        return cur.description, cur.fetchall()
+
+    def column_types(self) -> dict[str, WidgetColTypes]:
+        if self.is_duckdb:
+            sql = f"DESCRIBE SELECT * FROM {self.from_clause}"
+            return {row[0]: sql_col_type(row[1]) for row in self.execute(sql)[1]}
+        elif self.table is not None:
+            # sqlite only declares types for table (and view) columns
+            rows = self.execute(f"PRAGMA table_info({quote_ident(self.table)})")[1]
+            return {row[1]: sql_col_type(row[2]) for row in rows}
+
+        return {}
+
+
+def sql_table(con: Any, table: str | None = None, query: str | None = None) -> SqlTable:
+    """Show a table or query from a sqlite3 or DuckDB database.
+
+    The whole table or query is read when a table is created from it, so large tables should
+    be filtered or aggregated in the query. Rows are read with a single query, in batches.
+
+    Parameters
+    ----------
+    con:
+        A sqlite3 or DuckDB connection.
+    table:
+        The name of a table (or view) to show.
+    query:
+        A SELECT query to show. Exactly one of table or query must be given.
+
+    Examples
+    --------
+
+    ```{python}
+    import sqlite3
+    from reactable import Reactable, sql_table
+
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE t AS SELECT 1 AS x, 'a' AS y")
+    Reactable(sql_table(con, "t"))
+    ```
+    """
+    return SqlTable(con, table=table, query=query)
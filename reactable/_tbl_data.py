@@ -11,7 +11,7 @@ from abc import ABC
 
 
 if TYPE_CHECKING:
-    from polars import DataFrame as PlDataFrame, Series as PlSeries
+    from polars import DataFrame as PlDataFrame, LazyFrame as PlLazyFrame, Series as PlSeries
     from pandas import DataFrame as PdDataFrame, Series as PdSeries
 
 else:
@@ -23,6 +23,9 @@ else:
     class PdDataFrame(AbstractBackend):
         _backends = [("pandas", "DataFrame")]
 
+    class PlLazyFrame(AbstractBackend):
+        _backends = [("polars", "LazyFrame")]
+
     class PlSeries(AbstractBackend):
         _backends = [("polars", "Series")]
 
@@ -61,14 +64,16 @@ def _(x: PlSeries) -> WidgetColTypes:
     dtype = x.dtype
     if dtype.is_numeric():
         return "numeric"
-    elif dtype.is_temporal():
-        # TODO: this might be wrong for durations, etc..
+    elif dtype == pl.Date or isinstance(dtype, pl.Datetime):
         return "Date"
+    elif dtype.is_temporal():
+        # times of day and durations aren't dates, so can't be filtered as dates
+        return "UNKNOWN"
     elif dtype.is_(pl.String):
         return "character"
     elif dtype.is_(pl.Boolean):
         return "logical"
-    elif dtype.is_(pl.Categorical):
+    elif isinstance(dtype, (pl.Categorical, pl.Enum)):
         return "factor"
 
     return "UNKNOWN"
@@ -76,14 +81,34 @@ def _(x: PlSeries) -> WidgetColTypes:
 
 @col_type.register(PdSeries)
 def _(x: PdSeries) -> WidgetColTypes:
+    import pandas as pd
+    from pandas.api import types as ptypes
+
+    dtype = x.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "factor"
+    elif ptypes.is_bool_dtype(dtype):
+        return "logical"
+    elif ptypes.is_timedelta64_dtype(dtype):
+        return "UNKNOWN"
+    elif ptypes.is_numeric_dtype(dtype):
+        return "numeric"
+    elif ptypes.is_datetime64_any_dtype(dtype):
+        return "Date"
+    elif ptypes.is_object_dtype(dtype):
+        # object columns can hold anything, so infer from the values
+        return col_type(x.dropna().head(5).tolist())
+    elif ptypes.is_string_dtype(dtype):
+        return "character"
+
     return "UNKNOWN"
 
 
 @col_type.register(list)
 @col_type.register(SimpleColumn)
 def _(x: SimpleColumn | list) -> WidgetColTypes:
-    # TODO: this column is just a wrapper around lists, so need to infer type from that
-    dtype = _peek_type(x)
+    # typed columns know their type, otherwise we need to infer it from the values
+    dtype = x.dtype if isinstance(x, SimpleColumn) and x.dtype is not None else _peek_type(x)
 
     if dtype is int or dtype is float:
         return "numeric"
@@ -97,6 +122,32 @@ def _(x: SimpleColumn | list) -> WidgetColTypes:
         return "UNKNOWN"
 
 
+def sql_col_type(decl_type: str | None) -> WidgetColTypes:
+    """Return the widget column type for a declared SQL column type (e.g. "VARCHAR(20)").
+
+    This follows SQLite's type affinity rules, with additions for DuckDB types. Returns None
+    when the type is unknown, so it can be inferred from the column's values instead.
+    """
+    if not decl_type:
+        return None
+
+    decl = decl_type.upper()
+    if decl.startswith("INTERVAL"):
+        return None
+    elif "BOOL" in decl:
+        return "logical"
+    elif decl.startswith("ENUM"):
+        return "factor"
+    elif "INT" in decl or any(x in decl for x in ["REAL", "FLOA", "DOUB", "DEC", "NUMERIC"]):
+        return "numeric"
+    elif "DATE" in decl or "TIME" in decl:
+        return "Date"
+    elif any(x in decl for x in ["CHAR", "CLOB", "TEXT", "STRING", "UUID"]):
+        return "character"
+
+    return None
+
+
 def _peek_type(col: SimpleColumn | list):
     types = {type(x) for x in col[:5] if x is not None}
 
@@ -124,7 +175,10 @@ def _(data: PlDataFrame) -> "dict[str, list[Any]]":
 
 @to_dict.register
 def _(data: PdDataFrame) -> "dict[str, list[Any]]":
-    return data.to_dict(orient="list")
+    # convert the whole frame at once, since per column conversion is slow for wide frames
+    values = data.to_numpy(dtype=object, copy=True)
+    values[data.isna().to_numpy()] = None
+    return dict(zip(data.columns, values.T.tolist()))
 
 
 @to_dict.register
@@ -132,6 +186,65 @@ def _(data: SimpleFrame) -> "dict[str, list[Any]]":
     return data.to_dict()
 
 
+# to_columns ----------------------------------------------------------
+# Like to_dict, but keeps each column in its backend's native format, so no python
+# objects are created for each value.
+
+
+@singledispatch
+def to_columns(data: DataFrameLike) -> "dict[str, ColumnLike | list[Any]]":
+    raise TypeError(f"Unsupported type: {type(data)}")
+
+
+@to_columns.register
+def _(data: PlDataFrame) -> "dict[str, PlSeries]":
+    return {name: data.get_column(name) for name in data.columns}
+
+
+@to_columns.register
+def _(data: PdDataFrame) -> "dict[str, PdSeries]":
+    return dict(data.items())
+
+
+@to_columns.register
+def _(data: SimpleFrame) -> "dict[str, SimpleColumn]":
+    return dict(data.columns)
+
+
+# to_list -------------------------------------------------------------
+
+
+@singledispatch
+def to_list(x: ColumnLike) -> "list[Any]":
+    raise TypeError(f"Unsupported type: {type(x)}")
+
+
+@to_list.register
+def _(x: PlSeries) -> "list[Any]":
+    return x.to_list()
+
+
+@to_list.register
+def _(x: PdSeries) -> "list[Any]":
+    if not x.hasnans:
+        return x.tolist()
+
+    # replace NaN, NaT, and NA with None using a vectorized mask
+    values = x.to_numpy(dtype=object, copy=True)
+    values[x.isna().to_numpy()] = None
+    return values.tolist()
+
+
+@to_list.register
+def _(x: SimpleColumn) -> "list[Any]":
+    return x.to_list()
+
+
+@to_list.register
+def _(x: list) -> "list[Any]":
+    return x
+
+
 # column_names ---------------------------------------------------------
 
 
@@ -193,3 +306,37 @@ def _(
     rows_indx = slice(None) if rows is None else rows
 
     return data[rows_indx, cols_indx]
+
+
+@subset_frame.register
+def _(
+    data: SimpleFrame, rows: Optional[list[int]] = None, cols: Optional[list[str]] = None
+) -> SimpleFrame:
+
+    cols_indx = slice(None) if cols is None else cols
+    rows_indx = slice(None) if rows is None else rows
+
+    return data[rows_indx, cols_indx]
+
+
+# n_rows --------------------------------------------------------------
+
+
+@singledispatch
+def n_rows(data: DataFrameLike) -> int:
+    raise TypeError(f"Unsupported type: {type(data)}")
+
+
+@n_rows.register
+def _(data: PlDataFrame) -> int:
+    return data.height
+
+
+@n_rows.register
+def _(data: PdDataFrame) -> int:
+    return len(data)
+
+
+@n_rows.register
+def _(data: SimpleFrame) -> int:
+    return len(data)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import math
+import os
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Sequence, Union
+from typing_extensions import TypeAlias
+
+Workers: TypeAlias = Union[int, Executor, None]
+
+# each worker gets a few chunks, so one slow chunk doesn't hold up the rest
+CHUNKS_PER_WORKER = 4
+
+
+def _run_chunk(func: Callable[[int, Any], Any], start: int, items: Sequence[Any]) -> list[Any]:
+    return [func(ii, item) for ii, item in enumerate(items, start)]
+
+
+class CallbackRunner:
+    """Run a python callback for every row of a table.
+
+    Without an executor, callbacks run one after another. Otherwise rows are split into
+    chunks, which are run on the executor. Each call to map() waits for all of its rows, so
+    callbacks for different columns don't run at the same time. Results are always returned in row order, and
+    the first error (in row order) is raised.
+
+    Note that to run on a process pool, callbacks need to be picklable (e.g. defined at
+    the top-level of a module).
+
+    Parameters
+    ----------
+    executor:
+        An executor to run chunks of rows on.
+    n_workers:
+        The number of workers the executor has, used to decide chunk sizes.
+    """
+
+    def __init__(self, executor: Executor | None = None, n_workers: int = 1):
+        self.executor = executor
+        self.n_workers = n_workers
+
+    def map(self, func: Callable[[int, Any], Any], items: Sequence[Any]) -> list[Any]:
+        """Return func(ii, item) for each item, where ii is the row index."""
+        n_items = len(items)
+        if self.executor is None or n_items < 2:
+            return _run_chunk(func, 0, items)
+
+        size = max(1, math.ceil(n_items / (self.n_workers * CHUNKS_PER_WORKER)))
+        starts = range(0, n_items, size)
+        chunks = self.executor.map(
+            _run_chunk,
+            [func] * len(starts),
+            starts,
+            [items[start : start + size] for start in starts],
+        )
+
+        return [res for chunk in chunks for res in chunk]
+
+
+@contextmanager
+def callback_runner(workers: Workers) -> Iterator[CallbackRunner]:
+    """Create a CallbackRunner for the workers option.
+
+    An integer creates a thread pool with that many workers, which is shut down on exit.
+    An executor is used as is, and left running.
+    """
+
+    if workers is None or (isinstance(workers, int) and workers <= 1):
+        yield CallbackRunner()
+    elif isinstance(workers, Executor):
+        n_workers = getattr(workers, "_max_workers", None) or os.cpu_count() or 1
+        yield CallbackRunner(workers, n_workers)
+    elif isinstance(workers, int):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield CallbackRunner(executor, workers)
+    else:
+        raise TypeError(f"workers must be an int or an Executor, received: {type(workers)}")
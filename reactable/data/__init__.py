@@ -3,6 +3,7 @@ import json
 from datetime import datetime
 
 from importlib_resources import files
+from typing import Any, Callable
 from ..simpleframe import SimpleFrame
 
 BIG_DATA = files("reactable.data")
@@ -19,73 +20,117 @@ __all__ = [
     "us_expenditures",
 ]
 
-cars_93 = SimpleFrame.read_csv(BIG_DATA / "cars_93.csv").cast(
-    dict(
-        mpg_city=int,
-        mpg_highway=int,
-        price=float,
-        min_price=float,
-        max_price=float,
+
+def _load_cars_93() -> SimpleFrame:
+    return SimpleFrame.read_csv(
+        BIG_DATA / "cars_93.csv",
+        dtypes=dict(
+            mpg_city=int,
+            mpg_highway=int,
+            price=float,
+            min_price=float,
+            max_price=float,
+        ),
+    )
+
+
+def _load_co2() -> SimpleFrame:
+    return SimpleFrame.read_csv(
+        BIG_DATA / "co2.csv",
+        dtypes=dict(
+            conc=int,
+            uptake=float,
+        ),
+    )
+
+
+def _load_nottem() -> SimpleFrame:
+    return SimpleFrame.read_csv(
+        BIG_DATA / "nottem.csv",
+        dtypes=dict(
+            year=int,
+            Jan=float,
+            Feb=float,
+            Mar=float,
+            Apr=float,
+            May=float,
+            Jun=float,
+            Jul=float,
+            Aug=float,
+            Sep=float,
+            Oct=float,
+            Nov=float,
+            Dec=float,
+        ),
     )
-)
 
-co2 = SimpleFrame.read_csv(BIG_DATA / "co2.csv").cast(
-    dict(
-        conc=int,
-        uptake=float,
+
+def _load_penguins() -> SimpleFrame:
+    return SimpleFrame.read_csv(
+        BIG_DATA / "penguins.csv",
+        dtypes=dict(
+            bill_length_mm=float,
+            bill_depth_mm=float,
+            flipper_length_mm=float,
+            body_mass_g=float,
+            year=int,
+            sex=str,
+        ),
+        na_values="NA",
     )
-)
-
-nottem = SimpleFrame.read_csv(BIG_DATA / "nottem.csv").cast(
-    dict(
-        year=int,
-        Jan=float,
-        Feb=float,
-        Mar=float,
-        Apr=float,
-        May=float,
-        Jun=float,
-        Jul=float,
-        Aug=float,
-        Sep=float,
-        Oct=float,
-        Nov=float,
-        Dec=float,
+
+
+def _load_prices() -> SimpleFrame:
+    return SimpleFrame.from_dict(
+        {
+            "price_usd": [123456.56, 132, 5650.12],
+            "price_inr": [350, 23208.552, 1773156.4],
+            "number_fr": [123456.56, 132, 5650.12],
+            "temp": [22, None, 31],
+            "percent": [0.9525556, 0.5, 0.112],
+            "date": [datetime(2019, 1, 2), datetime(2019, 3, 15), datetime(2019, 9, 22)],
+        }
     )
-)
-
-penguins = SimpleFrame.read_csv(BIG_DATA / "penguins.csv").cast(
-    dict(
-        bill_length_mm=float,
-        bill_depth_mm=float,
-        flipper_length_mm=float,
-        body_mass_g=float,
-        year=int,
-        sex=str
-    ),
-    na_char="NA"
-)
-
-prices = SimpleFrame.from_dict(
-    {
-        "price_usd": [123456.56, 132, 5650.12],
-        "price_inr": [350, 23208.552, 1773156.4],
-        "number_fr": [123456.56, 132, 5650.12],
-        "temp": [22, None, 31],
-        "percent": [0.9525556, 0.5, 0.112],
-        "date": [datetime(2019, 1, 2), datetime(2019, 3, 15), datetime(2019, 9, 22)],
-    }
-)
-
-sleep = SimpleFrame.read_csv(BIG_DATA / "sleep.csv").cast(
-    dict(
-        extra=float,
-        group=int,
-        id=int,
+
+
+def _load_sleep() -> SimpleFrame:
+    return SimpleFrame.read_csv(
+        BIG_DATA / "sleep.csv",
+        dtypes=dict(
+            extra=float,
+            group=int,
+            id=int,
+        ),
     )
-)
 
-starwars = SimpleFrame.from_dict(json.load((BIG_DATA / "starwars.json").open()))
 
-us_states = SimpleFrame.read_csv(BIG_DATA / "us_states.csv").cast({"Area": int})
-us_expenditures = SimpleFrame.read_csv(BIG_DATA / "us_expenditures.csv")
+def _load_starwars() -> SimpleFrame:
+    return SimpleFrame.from_dict(json.load((BIG_DATA / "starwars.json").open()))
+
+
+def _load_us_states() -> SimpleFrame:
+    return SimpleFrame.read_csv(BIG_DATA / "us_states.csv", dtypes={"Area": int})
+
+
+def _load_us_expenditures() -> SimpleFrame:
+    return SimpleFrame.read_csv(BIG_DATA / "us_expenditures.csv")
+
+
+# Datasets are loaded on first access (rather than on import), and cached
+# as module attributes, so later access skips __getattr__ entirely.
+_LOADERS: dict[str, Callable[[], SimpleFrame]] = {
+    name: globals()[f"_load_{name}"] for name in __all__
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LOADERS:
+        data = _LOADERS[name]()
+        globals()[name] = data
+        return data
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
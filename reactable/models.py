@@ -4,11 +4,23 @@ from typing import TYPE_CHECKING, Any, Literal, Callable
 from typing_extensions import TypeAlias
 
 from dataclasses import asdict, dataclass, field, fields, replace, InitVar
-
-from ._tbl_data import DataFrameLike, col_type, column_names, to_dict
+from collections import OrderedDict
+from functools import partial
+
+from ._sources import DataSource, as_data_source
+from ._cache import CacheEntry, fingerprint, get_props_cache, payload_size
+from ._column_store import ColumnStore, check_row_keys
+from ._tbl_data import ColumnLike, DataFrameLike, PlLazyFrame, col_type, column_names
+from ._tbl_data import subset_frame, to_dict
+from ._tbl_data import n_rows as frame_n_rows
+from ._budget import MemoryUsage, estimate_memory_usage, sample_size
+from ._workers import CallbackRunner, Workers, callback_runner
+from ._profile import measure, record_payload
 from .tags import to_hydrate_format
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from htmltools import TagList
     from .options import Options
 
 
@@ -30,10 +42,11 @@ def filter_none(d: dict[str, Any]):
     return {k: v for k, v in d.items() if v is not None}
 
 
-def process_data(d: DataFrameLike) -> dict[str, list[Any]]:
-    return to_dict(d)
+def process_data(d: DataFrameLike | dict[str, list[Any]]) -> ColumnStore:
+    if isinstance(d, dict):
+        return ColumnStore(d)
 
-    raise TypeError(f"Unsupported type: {type(d)}")
+    return ColumnStore.from_frame(d)
 
 
 def cols_dict_to_list(cols: dict[str, Column] | list[Column]) -> list[Column]:
@@ -84,6 +97,7 @@ def default_columns(
 
 CAMEL_OVERRIDES: dict[str, str] = {
     "sort_na_last": "sortNALast",
+    "data_url": "dataURL",
 }
 
 
@@ -199,12 +213,30 @@ class ColInfo:
     name: str
 
 
+# the default number of distinct values cached for Column(cache="value")
+CACHE_SIZE = 4096
+
+
+# these are defined at the top-level (rather than as lambdas), so that callbacks
+# can be sent to a process pool (see CallbackRunner)
+def _render_cell(transform: Callable[[CellInfo], Any], col_id: str, ii: int, val: Any):
+    return to_hydrate_format(transform(CellInfo(val, ii, col_id)))
+
+
+def _render_details(details: Callable[[RowInfo], Any], name: str, ii: int, _: Any):
+    return to_hydrate_format(details(RowInfo(ii, name)))
+
+
+def _render_row(transform: Callable[[int], Any], ii: int, _: Any):
+    return to_hydrate_format(transform(ii))
+
+
 # Props ----
 
 
 @dataclass
 class Props:
-    data: dict[str, list[Any]] | DataFrameLike
+    data: dict[str, list[Any]] | DataFrameLike | DataSource | ColumnStore
     columns: list[Column] | None = None
     column_groups: list[ColGroup] | None = None
     rownames: InitVar[bool] = False
@@ -261,6 +293,8 @@ class Props:
     element_id: str | None = None
     static: bool | None = None
     dataKey: str | None = None
+    workers: InitVar[Workers] = None
+    row_key: InitVar[str | None] = None
 
     # derived props ----
     default_sort_desc: bool = field(init=False)
@@ -281,9 +315,36 @@ class Props:
         class_: str | list[str] | None,
         row_class: list[str] | Callable[RowIndx, list[str]] | None,
         full_width: bool | None,
+        workers: Workers,
+        row_key: str | None,
     ):
+        # data that isn't in memory yet ----
+        # polars LazyFrames are collected once, and shown like any other DataFrame
+        if isinstance(self.data, PlLazyFrame):
+            with measure("fetch"):
+                self.data = self.data.collect()
+
+        # other sources (e.g. generators or database cursors) are read in full
+        source = as_data_source(self.data)
+        if source is not None:
+            with measure("fetch"):
+                self.data = source.to_frame()
+
+            if not column_names(self.data):
+                raise ValueError(
+                    "The data source is empty, so its columns are unknown. "
+                    "Use data_source(..., columns=[...]) to name them."
+                )
+
         # columns ----
-        _simple_cols = default_columns(self.data, default_col_def)
+        with measure("default_columns"):
+            _simple_cols = default_columns(self.data, default_col_def)
+            if source is not None:
+                # declared types (e.g. from a database schema) beat types inferred from values
+                source_types = source.column_types()
+                for col in _simple_cols:
+                    if source_types.get(col.id) is not None:
+                        col.type = source_types[col.id]
         if self.columns is None:
             # TODO: does not apply defaultColDef
             self.columns = _simple_cols
@@ -293,18 +354,32 @@ class Props:
 
         self.validate_columns()
 
-        # data ----
-        # from this point on, self.data is a dictionary
-        if isinstance(self.data, DataFrameLike):
-            self.data = process_data(self.data)
+        if row_key is not None and row_key not in [col.id for col in self.columns]:
+            raise ValueError(f"row_key must be a column in the data, received: {row_key!r}")
+
+        self._row_key = row_key
 
         self.default_sorted = self.derive_default_sorted(default_sort_order)
         self.group_by = [self.group_by] if isinstance(self.group_by, str) else self.group_by
 
+        # payload budget ----
+        # the size of the data is estimated from a sample of rows, to warn about tables
+        # that are too large to send within the payload budget
+        with measure("estimate"):
+            usage = self._estimate_memory_usage()
+
+        # data ----
+        # from this point on, self.data is a ColumnStore, which keeps the data's native
+        # columns until they are serialized (or needed by a python callback)
+        with measure("process_data"):
+            self.data = process_data(self.data)
+
+        if row_key is not None:
+            check_row_keys(self.data[row_key], row_key)
+
         # TODO: would be nice to put at top of function
         # but needs to be after data processing for now
-        # TODO: will fail for data with no columns
-        n_rows = len(list(self.data.values())[0])
+        n_rows = self.data.n_rows
 
         # simple derived properties ----
         self.default_sort_desc = default_sort_order == "desc"
@@ -357,7 +432,7 @@ class Props:
                 filterable=False,
             )
 
-            self.data = {".rownames": list(range(n_rows)), **self.data}
+            self.data = self.data.insert(".rownames", list(range(n_rows)), first=True)
         else:
             col_rownames = None
 
@@ -371,20 +446,28 @@ class Props:
         if col_select:
             self.columns = [col_select, *self.columns]
 
-        # initialize columns ----
-        self.columns = [col.init_data(self.data) for col in self.columns]
+        # run python callbacks ----
+        if workers is None:
+            workers = get_options().workers
 
-        # row classes ----
-        if callable(row_class):
-            self.row_class_name = [to_hydrate_format(row_class(ii)) for ii in range(n_rows)]
-        else:
-            self.row_class_name = row_class
+        with callback_runner(workers) as runner:
+            # initialize columns ----
+            with measure("columns"):
+                self.columns = [self._init_column(col, runner) for col in self.columns]
 
-        # row style ----
-        if callable(self.row_style):
-            self.row_style = [to_hydrate_format(self.row_style(ii)) for ii in range(n_rows)]
-        elif isinstance(self.row_style, str):
-            raise NotImplementedError()
+            # row classes ----
+            if callable(row_class):
+                with measure("row_class"):
+                    self.row_class_name = runner.map(partial(_render_row, row_class), range(n_rows))
+            else:
+                self.row_class_name = row_class
+
+            # row style ----
+            if callable(self.row_style):
+                with measure("row_style"):
+                    self.row_style = runner.map(partial(_render_row, self.row_style), range(n_rows))
+            elif isinstance(self.row_style, str):
+                raise NotImplementedError()
 
         # apply global options ----
         if self.theme is None:
@@ -393,6 +476,15 @@ class Props:
         if self.language is None:
             self.language = replace(get_options().language)
 
+        usage.callback_bytes = self._callback_bytes()
+        usage.warn_if_over_budget()
+
+        self._memory_usage = usage
+
+    def _init_column(self, col: Column, runner: CallbackRunner) -> Column:
+        with measure("init_data", column=col.id):
+            return col.init_data(self.data, runner)
+
     @staticmethod
     def complete_columns(
         simple_cols: list[Column], default: Column | None, columns: list[Column]
@@ -439,6 +531,28 @@ class Props:
             if col.id not in names:
                 raise ValueError(f"Column id '{col.id}' is not a column name in the data.")
 
+    def _estimate_memory_usage(self) -> MemoryUsage:
+        k = sample_size(len(self.columns))
+        if isinstance(self.data, dict):
+            n = len(next(iter(self.data.values()), []))
+            sample = {name: col[:k] for name, col in self.data.items()}
+        else:
+            n = frame_n_rows(self.data)
+            sample = to_dict(subset_frame(self.data, rows=slice(k)))
+
+        col_types = {col.id: col.type for col in self.columns}
+        usage = estimate_memory_usage(sample, n, col_types)
+        usage.budget = get_options().payload_budget
+        return usage
+
+    def _callback_bytes(self) -> int:
+        """Return the size of props rendered for each row, e.g. by python callbacks."""
+        rendered = [self.row_class_name, self.row_style]
+        for col in self.columns:
+            rendered.extend([col.cell, col.class_, col.style, col.details])
+
+        return sum(payload_size(x) for x in rendered if isinstance(x, list))
+
     def validate_groupBy(self):
         if self.group_by is None:
             return
@@ -454,10 +568,14 @@ class Props:
                 "groupBy columns cannot have `details` set.\n\n" f"Affected columns: {details}"
             )
 
-    def to_props(self):
+    def _config_props(self) -> dict[str, Any]:
+        """Return props for every field except data."""
         props_list = ["columns", "column_groups"]
         out = {}
         for field in fields(self):
+            if field.name == "data":
+                continue
+
             attr = getattr(self, field.name)
             f_props = getattr(attr, "to_props", None)
             res = f_props() if f_props is not None else attr
@@ -467,7 +585,53 @@ class Props:
 
             out[field.name] = res
 
-        return to_camel_dict(filter_none(out))
+        return out
+
+    def _props_from_config(self, config: dict[str, Any]) -> dict[str, Any]:
+        with measure("to_props"):
+            data = self.data.to_props()
+            props = to_camel_dict(filter_none({"data": data, **config}))
+            record_payload(props)
+
+        return props
+
+    def memory_usage(self) -> MemoryUsage:
+        """Return the estimated size of the table's data, when sent to the browser.
+
+        Tables whose data is estimated to be over the payload budget
+        (`options.payload_budget`) warn when they are created.
+        """
+        return self._memory_usage
+
+    def to_props(self):
+        with measure("config"):
+            config = self._config_props()
+
+        return self._props_from_config(config)
+
+    def _cached_props(self) -> CacheEntry:
+        """Return props, re-using them if an identical table was converted before.
+
+        Tables are identified by a fingerprint of their data and config, which is
+        cheaper to compute than serializing the data. Tables whose data isn't (e.g. lists
+        of python objects) are not cached.
+        """
+        config = self._config_props()
+        cache = get_props_cache(get_options().cache_size)
+
+        # options that affect the props or widget, but are not props themselves
+        extra = {"row_key": self._row_key}
+        key = fingerprint(self.data, {**config, ".options": extra}) if cache.max_size else None
+        if key is None:
+            return CacheEntry(self._props_from_config(config), 0)
+
+        entry = cache.get(key)
+        if entry is None:
+            # sized from the table's estimated memory usage, rather than walking the props
+            props = self._props_from_config(config)
+            entry = cache.put(key, props, self._memory_usage.sent_bytes)
+
+        return entry
 
 
 """
@@ -654,6 +818,17 @@ class Column:
         Additional CSS classes to apply to the footer.
     footer_style:
         Inline styles to apply to the footer. A named list or character string.
+    vectorized:
+        Whether Python functions passed to cell, class_, and style are called once with the
+        whole column, rather than once per cell with a `CellInfo()` object. The column is passed
+        in its native format (e.g. a pandas or polars Series), and the function should return a
+        sequence of results, one per row.
+    cache:
+        Whether to memoize the results of Python functions passed to cell, class_, and style
+        by cell value. Use this when a function only depends on the cell value (e.g. to render
+        a badge for a status column), so it is called once per distinct value. Either "value"
+        to cache up to 4096 distinct values, or the maximum number of values to cache. Cells
+        with the same value share the same result.
     id:
         This is currently used internally, and should not be set by the user.
     """
@@ -696,6 +871,8 @@ class Column:
     header_style: CssStyles | None = None
     footer_class: list[str] | None = None
     footer_style: CssRules | None = None
+    vectorized: bool | None = None
+    cache: Literal["value"] | int | None = None
     id: str | None = None
 
     # props ----
@@ -724,17 +901,93 @@ class Column:
         else:
             self.default_sort_desc = None
 
-    def _apply_transform(self, col_data: list[Any], transform: callable):
-        return [
-            to_hydrate_format(transform(CellInfo(val, ii, self.id)))
-            for ii, val in enumerate(col_data)
-        ]
+        if self.cache is not None:
+            if self.vectorized:
+                raise ValueError("cache cannot be used with vectorized=True")
+            if self.cache != "value" and not (isinstance(self.cache, int) and self.cache > 0):
+                raise ValueError(
+                    f'cache must be "value" or a positive int, received: {self.cache!r}'
+                )
+
+    def _apply_transform(
+        self,
+        col_data: list[Any] | ColumnLike,
+        transform: callable,
+        runner: CallbackRunner,
+    ):
+        if self.vectorized:
+            return self._apply_vectorized(col_data, transform)
+        elif self.cache is not None:
+            return self._apply_cached(col_data, transform)
+
+        return runner.map(partial(_render_cell, transform, self.id), col_data)
+
+    def _apply_cached(self, col_data: list[Any], transform: callable):
+        maxsize = CACHE_SIZE if self.cache == "value" else self.cache
+        cache: OrderedDict[tuple[type, Any], Any] = OrderedDict()
+
+        out = []
+        for ii, val in enumerate(col_data):
+            # the type is part of the key, since e.g. True == 1, but may be rendered differently
+            key = (type(val), val)
+            try:
+                res = cache[key]
+            except KeyError:
+                res = cache[key] = _render_cell(transform, self.id, ii, val)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            except TypeError:
+                # unhashable values (e.g. lists) are not cached
+                res = _render_cell(transform, self.id, ii, val)
+            else:
+                cache.move_to_end(key)
+
+            out.append(res)
+
+        return out
+
+    def _apply_vectorized(self, col_data: list[Any] | ColumnLike, transform: callable):
+        res = transform(col_data)
+
+        # Series have .to_list(), while numpy arrays have .tolist()
+        if hasattr(res, "to_list"):
+            res = res.to_list()
+        elif hasattr(res, "tolist"):
+            res = res.tolist()
+
+        res = list(res)
+        if len(res) != len(col_data):
+            raise ValueError(
+                f"Vectorized function for column {self.id!r} must return one result per row. "
+                f"Data has {len(col_data)} rows, result has {len(res)}."
+            )
 
-    def init_data(self, data: dict[str, list[Any]]) -> Column:
+        return [to_hydrate_format(x) for x in res]
+
+    def _uses_values(self) -> bool:
+        if callable(self.footer):
+            return True
+
+        if self.vectorized:
+            return False
+
+        return any(callable(f) for f in [self.cell, self.class_, self.style])
+
+    def init_data(self, data: ColumnStore, runner: CallbackRunner | None = None) -> Column:
         # TODO: what can we expect set at this stage? name? etc..?
         # TODO: this is a hack to handle cols like .details
-        n_rows = len(list(data.values())[0])
-        col_data = data[self.id] if not self.id.startswith(".") else [None] * n_rows
+        n_rows = data.n_rows
+        if self.id.startswith("."):
+            values = native = [None] * n_rows
+        else:
+            native = data.get_column(self.id)
+            # only create python values for columns passed to python callbacks
+            values = data[self.id] if self._uses_values() else native
+
+        col_data = native if self.vectorized else values
+
+        if runner is None:
+            runner = CallbackRunner()
 
         new_col = replace(self)
 
@@ -744,11 +997,11 @@ class Column:
         if isinstance(self.cell, JS):
             pass
         if callable(self.cell):
-            new_col.cell = self._apply_transform(col_data, self.cell)
+            new_col.cell = self._apply_transform(col_data, self.cell, runner)
 
         # class to apply to cells ----
         if callable(self.class_):
-            new_col.class_ = self._apply_transform(col_data, self.class_)
+            new_col.class_ = self._apply_transform(col_data, self.class_, runner)
 
         # header: transform or set string as react tag ----
         if callable(self.header):
@@ -758,7 +1011,7 @@ class Column:
         # footer: transform or set string as react tag ----
         if callable(self.footer):
             # TODO: validate result is a string (e.g. int will raise on js side)
-            new_col.footer = to_hydrate_format(self.footer(ColInfo(col_data, new_col.name)))
+            new_col.footer = to_hydrate_format(self.footer(ColInfo(values, new_col.name)))
         elif isinstance(self.footer, JS):
             pass
         else:
@@ -766,11 +1019,8 @@ class Column:
 
         # details: transform ----
         if callable(self.details):
-            new_col.details = list(
-                map(
-                    to_hydrate_format,
-                    [self.details(RowInfo(ii, self.name)) for ii in range(len(col_data))],
-                )
+            new_col.details = runner.map(
+                partial(_render_details, self.details, self.name), range(n_rows)
             )
 
         # filterInput: transform or set string as react tag ----
@@ -780,7 +1030,7 @@ class Column:
         # style: transform ----
         # overall style
         if callable(self.style):
-            new_col.style = self._apply_transform(col_data, self.style)
+            new_col.style = self._apply_transform(col_data, self.style, runner)
         elif isinstance(self.style, list):
             if len(self.style) != n_rows:
                 raise ValueError(
@@ -815,6 +1065,11 @@ class Column:
                 "header_class": "header_class_name",
             },
         )
+
+        # vectorized and cache only change how python callbacks are run
+        del renamed["vectorized"]
+        del renamed["cache"]
+
         return to_camel_dict(filter_none(renamed))
 
 
@@ -1085,7 +1340,10 @@ class Reactable(Props):
     Parameters
     ----------
     data:
-        The data.
+        The data. Either a DataFrame, a polars LazyFrame (e.g. from `pl.scan_parquet()`),
+        or a source of rows, such as a generator, a DB-API cursor, a `data_source()`, or
+        a `sql_table()`. Tables are not paged from their data: LazyFrames are collected, and
+        every row of a source is read into memory, when the table is created.
     columns:
         Named list of column definitions.
     column_groups:
@@ -1176,6 +1434,18 @@ class Reactable(Props):
         Custom metadata to pass to JavaScript render functions or style functions.
     element_id:
         Element ID for the widget
+    workers:
+        How to run Python callbacks (e.g. for cell, style, and details). Either a number of
+        threads to split rows across, or a `concurrent.futures.Executor` (e.g. a process pool)
+        to run them on. Only rows run in parallel: columns (and row_class and row_style) are
+        still run one after another, each splitting its rows across the workers. Results are
+        in row order regardless. Defaults to the global `options.workers`, which runs
+        callbacks one after another.
+    row_key:
+        Name of a column that uniquely identifies rows, used to refer to rows when updating
+        the data of a widget (e.g. with `ReactableWidget.patch_cells()`). Its values must be
+        unique. Defaults to the position of rows in the original data. Updates are not
+        incremental: the widget sends all of its data again after each one.
 
 
     Examples
@@ -1201,14 +1471,54 @@ class Reactable(Props):
 
     """
 
-    def tagify(self) -> str:
-        # to appease htmltools
-        return str(self)
+    def tagify(self) -> TagList:
+        """Return the table as html, for use with htmltools (e.g. in Shiny apps or reports)."""
+        from ._html import table_tags
+
+        data = self.data.to_props()
+        props = to_camel_dict(filter_none({"data": data, **self._config_props()}))
+        return table_tags(props).tagify()
+
+    def to_html(self, path: str | Path | None = None, title: str = "") -> str:
+        """Render the table as a single file html page.
+
+        The page loads React from esm.sh, so viewing it needs network access.
+
+        Parameters
+        ----------
+        path:
+            A file to save the page to.
+        title:
+            The title of the page.
+
+        Returns
+        -------
+        :
+            The html of the page.
+        """
+        from ._html import to_html
+
+        return to_html(self, path=path, title=title)
 
     def _repr_mimebundle_(self, **kwargs: dict) -> tuple[dict, dict] | None:
-        return self.to_widget()._repr_mimebundle_()
+        entry = self._cached_props()
+
+        # displaying an identical table re-uses its widget, as long as its
+        # data hasn't been updated since.
+        widget = entry.widget
+        if widget is None or widget.comm is None or widget._updated:
+            widget = entry.widget = self._new_widget(entry.props)
+
+        return widget._repr_mimebundle_()
 
     def to_widget(self):
+        return self._new_widget(self._cached_props().props)
+
+    def _new_widget(self, props: dict[str, Any]):
         from .widgets import ReactableWidget
 
-        return ReactableWidget(props=self.to_props())
+        return ReactableWidget(
+            props=props,
+            data=self.data,
+            row_key=self._row_key,
+        )
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 from .models import Theme, Language
+from ._workers import Workers
+from ._profile import PhaseRecord
 
 
 @dataclass
 class Options:
     theme: Theme = field(default_factory=Theme)
     language: Language = field(default_factory=Language)
+    workers: Workers = None
+    # the maximum size in bytes of props kept for re-displaying identical tables
+    cache_size: int = 64 * 2**20
+    # the most bytes of data tables send to the browser up front (see Reactable.memory_usage)
+    payload_budget: int | None = 64 * 2**20
+    # called with a PhaseRecord as each phase of building a table finishes (see profile())
+    instrument: Callable[[PhaseRecord], None] | None = None
 
     def __setattr__(self, name, value):
         # validate options
@@ -19,6 +29,10 @@ class Options:
     def reset(self):
         self.theme = Theme()
         self.language = Language()
+        self.workers = None
+        self.cache_size = 64 * 2**20
+        self.payload_budget = 64 * 2**20
+        self.instrument = None
 
 
 options = Options()
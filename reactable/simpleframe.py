@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import csv
+
+from array import array
 from dataclasses import dataclass
-from typing import Any, Generic, overload
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, overload
 from typing_extensions import TypeAlias, TypeVar, Self
 from pathlib import Path
 
@@ -40,9 +43,105 @@ def _multi_getitem(x, indx: list[Any] | slice):
         raise TypeError(f"Unsupported type: {type(x)}")
 
 
-@dataclass
+# Python types with a typed array representation, and their array typecodes.
+# Note that bools are stored as signed chars, and converted back when read.
+_TYPECODES: dict[type, str] = {bool: "b", int: "q", float: "d"}
+
+
+def _infer_typecode(values: list[Any]) -> str | None:
+    types = {type(x) for x in values if x is not None}
+    if len(types) == 1:
+        return _TYPECODES.get(types.pop())
+
+    return None
+
+
 class SimpleColumn(Generic[T]):
-    values: list[T]
+    """A column of values.
+
+    Columns of bools, ints, or floats are stored in a typed array, with missing values
+    tracked in a separate validity mask. Other columns are stored as a list.
+
+    Typed columns are accessed through memoryviews, so slicing them returns a view onto
+    the same memory, rather than a copy.
+    """
+
+    __slots__ = ("_data", "_valid", "_dtype")
+
+    _data: memoryview | list[T]
+    _valid: memoryview | None
+    _dtype: type | None
+
+    def __init__(self, values: list[T] | tuple[T, ...] = ()):
+        if isinstance(values, SimpleColumn):
+            self._data, self._valid, self._dtype = values._data, values._valid, values._dtype
+            return
+
+        values = values if isinstance(values, list) else list(values)
+
+        typecode = _infer_typecode(values)
+        if typecode is not None:
+            try:
+                arr = array(typecode, (0 if x is None else x for x in values))
+            except OverflowError:
+                # e.g. ints that don't fit into 64 bits
+                typecode = None
+
+        if typecode is None:
+            self._data, self._valid, self._dtype = values, None, None
+            return
+
+        if any(x is None for x in values):
+            valid = memoryview(bytes(x is not None for x in values))
+        else:
+            valid = None
+
+        self._data, self._valid = memoryview(arr), valid
+        self._dtype = next(k for k, v in _TYPECODES.items() if v == typecode)
+
+    @classmethod
+    def _from_parts(
+        cls, data: memoryview | list[T], valid: memoryview | None, dtype: type | None
+    ) -> Self:
+        col = cls.__new__(cls)
+        col._data, col._valid, col._dtype = data, valid, dtype
+        return col
+
+    def __reduce__(self):
+        # memoryviews can't be pickled (or deep copied), so typed columns are saved as bytes
+        if self._dtype is None:
+            return (_restore_column, (type(self), self._data))
+
+        valid = self._valid.tobytes() if self._valid is not None else None
+        parts = (self._data.format, self._data.tobytes(), valid, self._dtype)
+        return (_restore_column, (type(self), None, *parts))
+
+    @property
+    def dtype(self) -> type | None:
+        """The python type of values in a typed column, or None for other columns."""
+        return self._dtype
+
+    @property
+    def buffer(self) -> memoryview | None:
+        """A memoryview of the values in a typed column (missing values are 0)."""
+        return self._data if self._dtype is not None else None
+
+    @property
+    def valid(self) -> memoryview | None:
+        """A mask with 1 for each non-missing value, or None when no values are missing."""
+        return self._valid
+
+    @property
+    def values(self) -> list[T]:
+        return self.to_list()
+
+    def _get_value(self, ii: int) -> T:
+        if self._valid is not None and not self._valid[ii]:
+            return None
+        elif self._dtype is bool:
+            return bool(self._data[ii])
+
+        return self._data[ii]
 
     @overload
     def __get_item__(self, indx: RowValIndex) -> T: ...
@@ -52,24 +151,47 @@ class SimpleColumn(Generic[T]):
 
     def __getitem__(self, indx: RowIndex) -> Self:
         if isinstance(indx, int):
-            return self.values[indx]
+            return self._get_value(indx)
 
         elif isinstance(indx, list):
-            return self.__class__([self.values[ii] for ii in indx])
+            if self._dtype is None:
+                return self._from_parts([self._data[ii] for ii in indx], None, None)
+
+            data = memoryview(array(self._data.format, (self._data[ii] for ii in indx)))
+            valid = None
+            if self._valid is not None:
+                valid = memoryview(bytes(self._valid[ii] for ii in indx))
+
+            return self._from_parts(data, valid, self._dtype)
 
         elif isinstance(indx, slice):
-            return self.__class__(self.values[indx])
+            valid = self._valid[indx] if self._valid is not None else None
+            return self._from_parts(self._data[indx], valid, self._dtype)
 
         raise TypeError(f"Unsupported type: {type(indx)}")
 
+    def __iter__(self):
+        if self._dtype is None:
+            return iter(self._data)
+
+        return iter(self.to_list())
+
     def __len__(self):
-        return len(self.values)
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SimpleColumn):
+            return NotImplemented
+
+        return self.to_list() == other.to_list()
+
+    __hash__ = None
 
     def _repr(self, n: int | None = None, include_name=True):
-        if n is not None and len(self.values) <= n:
-            repr_vals = repr(self.values)
+        if n is not None and len(self) <= n:
+            repr_vals = repr(self.to_list())
         else:
-            repr_vals = repr(list(self.values[:5]) + ["..."])
+            repr_vals = repr(self[:5].to_list() + ["..."])
 
         if include_name:
             return f"{self.__class__.__name__}({repr_vals})"
@@ -79,8 +201,87 @@ class SimpleColumn(Generic[T]):
     def __repr__(self):
         return self._repr(n=5)
 
-    def to_list(self):
-        return self.values
+    def to_list(self) -> list[T]:
+        if self._dtype is None:
+            return self._data if isinstance(self._data, list) else list(self._data)
+
+        values = self._data.tolist()
+        if self._dtype is bool:
+            values = [bool(x) for x in values]
+
+        if self._valid is not None:
+            return [x if is_valid else None for x, is_valid in zip(values, self._valid)]
+
+        return values
+
+    def to_numpy(self):
+        """Return a numpy array viewing the values of a typed column, without copying.
+
+        Missing values are 0. Use the `valid` mask to find them.
+        """
+        import numpy as np
+
+        if self._dtype is None:
+            return np.array(self._data, dtype=object)
+
+        arr = np.asarray(self._data)
+        return arr.view(np.bool_) if self._dtype is bool else arr
+
+    def to_pandas(self, name: str | None = None):
+        """Return the column as a pandas Series.
+
+        Typed columns are always nullable pandas arrays (e.g. Int64 or boolean), whether or
+        not they have missing values, so their dtype doesn't depend on the data. Other
+        columns are object Series.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if self._dtype is None:
+            return pd.Series(self._data, name=name, dtype=object)
+
+        # nullable pandas arrays hold the values and missing mask separately, like us
+        if self._valid is None:
+            mask = np.zeros(len(self._data), dtype=bool)
+        else:
+            mask = np.asarray(self._valid) == 0
+        array_types = {
+            bool: pd.arrays.BooleanArray,
+            int: pd.arrays.IntegerArray,
+            float: pd.arrays.FloatingArray,
+        }
+        values = array_types[self._dtype](self.to_numpy(), mask)
+        return pd.Series(values, name=name, copy=False)
+
+    def to_polars(self, name: str = ""):
+        import numpy as np
+        import polars as pl
+
+        if self._dtype is None:
+            return pl.Series(name, self.to_list(), strict=False)
+
+        ser = pl.Series(name, self.to_numpy())
+        if self._valid is not None:
+            ser = ser.scatter(np.flatnonzero(np.asarray(self._valid) == 0), None)
+
+        return ser
+
+
+def _restore_column(
+    cls: type[SimpleColumn],
+    values: list[Any] | None,
+    typecode: str | None = None,
+    data: bytes | None = None,
+    valid: bytes | None = None,
+    dtype: type | None = None,
+) -> SimpleColumn:
+    """Re-create a pickled SimpleColumn."""
+    if typecode is None:
+        return cls._from_parts(values, None, None)
+
+    arr = array(typecode)
+    arr.frombytes(data)
+    return cls._from_parts(memoryview(arr), memoryview(valid) if valid is not None else None, dtype)
 
 
 @dataclass
@@ -228,30 +429,225 @@ class SimpleFrame:
     def to_pandas(self):
         import pandas as pd
 
-        return pd.DataFrame(self.to_dict())
+        return pd.DataFrame({k: col.to_pandas(k) for k, col in self.columns.items()}, copy=False)
 
     def to_polars(self):
         import polars as pl
 
-        return pl.DataFrame(self.to_dict(), strict=False)
+        return pl.DataFrame([col.to_polars(k) for k, col in self.columns.items()])
 
     @classmethod
-    def read_csv(cls, fname: str | Path):
-        with open(fname) as f:
+    def read_csv(
+        cls,
+        fname: str | Path,
+        dtypes: dict[str, Callable[[str], Any]] | None = None,
+        na_values: str | Iterable[str] | None = None,
+        infer_types: bool = False,
+        chunksize: int = 10_000,
+    ) -> Self:
+        """Read a csv file, parsing and casting columns in a single pass.
+
+        Parameters
+        ----------
+        fname:
+            Path to the csv file. The first row must be the column names.
+        dtypes:
+            A mapping of column name to a type (e.g. int, float, bool) or function used to
+            convert each value. Columns not specified are kept as strings.
+        na_values:
+            Strings to treat as missing values in converted columns, and in every column
+            when `infer_types` is True.
+        infer_types:
+            Whether to infer bool, int, or float types for columns not in `dtypes`. Types
+            are inferred from the first rows of each column. If later rows don't fit, ints
+            become floats, while other columns fall back to strings (re-read from the file,
+            so values are exactly as written).
+        chunksize:
+            Number of rows to read and convert at a time. Only one chunk of rows is held
+            in memory while reading.
+        """
+        dtypes = dtypes or {}
+        na = {na_values} if isinstance(na_values, str) else set(na_values or ())
+
+        with open(fname, newline="") as f:
             reader = csv.reader(f)
             try:
                 fieldnames = next(reader)
             except StopIteration:
                 return SimpleFrame({})
 
-            cols = zip(*reader)
-            data = dict(zip(fieldnames, cols))
+            builders = [_ColumnBuilder(dtypes.get(name), na, infer_types) for name in fieldnames]
+            while chunk := list(islice(reader, chunksize)):
+                for builder, raw in zip(builders, zip(*chunk)):
+                    builder.extend(raw)
+
+            # columns that fell back to strings re-read the values they had parsed
+            reread = {ii: [] for ii, builder in enumerate(builders) if builder.n_reread}
+            if reread:
+                f.seek(0)
+                n_rows = max(builders[ii].n_reread for ii in reread)
+                for n, row in enumerate(islice(csv.reader(f), 1, n_rows + 1)):
+                    for ii, raw in reread.items():
+                        if n < builders[ii].n_reread:
+                            raw.append(row[ii])
 
-            return cls.from_dict(data)
+                for ii, raw in reread.items():
+                    builders[ii].prepend(raw)
 
-    def cast(self, col_mapping: dict[str, Any], na_char: str|None = None) -> Self:
+            return cls({name: builder.finish() for name, builder in zip(fieldnames, builders)})
+
+    def cast(self, col_mapping: dict[str, Any], na_char: str | None = None) -> Self:
         new_columns = {**self.columns}
         for k, call in col_mapping.items():
             new_columns[k] = [call(x) if x != na_char else None for x in self.columns[k]]
 
         return self.__class__(new_columns)
+
+
+# read_csv helpers ----
+
+
+def _parse_bool(x: str) -> bool:
+    if x in _TRUE_STRINGS:
+        return True
+    elif x in _FALSE_STRINGS:
+        return False
+
+    raise ValueError(f"Cannot convert to bool: {x!r}")
+
+
+_TRUE_STRINGS = {"True", "TRUE", "true"}
+_FALSE_STRINGS = {"False", "FALSE", "false"}
+_PARSERS: dict[type, Callable[[str], Any]] = {bool: _parse_bool}
+
+
+def _infer_csv_dtype(values: list[str]) -> type | None:
+    """Return the narrowest of bool, int, or float that can parse all values."""
+    for dtype in [bool, int, float]:
+        parse = _PARSERS.get(dtype, dtype)
+        try:
+            for x in values:
+                parse(x)
+        except ValueError:
+            continue
+
+        return dtype
+
+    return None
+
+
+class _ColumnBuilder:
+    """Accumulate a column from chunks of csv strings, converting as they arrive.
+
+    Values of bool, int, and float columns go straight into a typed array, so
+    the column never exists as a list of python objects.
+    """
+
+    def __init__(self, dtype: Callable[[str], Any] | None, na: set[str], infer: bool):
+        self.dtype = dtype
+        self.na = na
+        self.infer = infer and dtype is None
+        self.inferred = False
+
+        self.values: array | list[Any] = []
+        self.valid: bytearray | None = None
+        self.n_leading_missing = 0
+
+        # the number of rows whose raw strings need to be re-read from the file
+        self.n_reread = 0
+
+        if dtype in _TYPECODES:
+            self.values = array(_TYPECODES[dtype])
+
+    @property
+    def is_typed(self) -> bool:
+        return isinstance(self.values, array)
+
+    def _start_inferred(self, raw: tuple[str, ...]) -> bool:
+        present = [x for x in raw if x not in self.na]
+        if not present:
+            # can't infer a type yet, so just count the missing values
+            self.n_leading_missing += len(raw)
+            return False
+
+        self.infer, self.inferred = False, True
+        self.dtype = _infer_csv_dtype(present)
+        self.values = array(_TYPECODES[self.dtype]) if self.dtype is not None else []
+
+        if self.n_leading_missing:
+            self._append([None] * self.n_leading_missing)
+
+        return True
+
+    def _append(self, parsed: list[Any]) -> None:
+        if not self.is_typed:
+            self.values.extend(parsed)
+            return
+
+        # convert the whole chunk before extending, so an overflow leaves values unchanged
+        n_prev = len(self.values)
+        self.values.extend(array(self.values.typecode, (0 if x is None else x for x in parsed)))
+
+        if None in parsed:
+            if self.valid is None:
+                self.valid = bytearray(b"\x01" * n_prev)
+            self.valid.extend(x is not None for x in parsed)
+        elif self.valid is not None:
+            self.valid.extend(b"\x01" * len(parsed))
+
+    def _fallback(self, dtype: Callable[[str], Any] | None, typed: bool) -> None:
+        """Move values so far to more general storage, e.g. from ints to floats or a list."""
+        values = self.finish().to_list()
+        self.dtype, self.valid = dtype, None
+
+        if typed:
+            # parsing ints as floats gives the same values as parsing their strings
+            self.values = array(_TYPECODES[dtype])
+            self._append([None if x is None else dtype(x) for x in values])
+        elif dtype is None:
+            # parsed values may not match their strings (e.g. "007" and 7), so strings
+            # are re-read once the whole file has been read
+            self.n_reread, self.values = len(values), []
+        else:
+            self.values = values
+
+    def prepend(self, raw: list[str]) -> None:
+        """Add the re-read strings of rows before a fallback to strings."""
+        self.values[:0] = [None if x in self.na else x for x in raw]
+
+    def extend(self, raw: tuple[str, ...]) -> None:
+        if self.infer and not self._start_inferred(raw):
+            return
+
+        if self.dtype is None:
+            self.values.extend([None if x in self.na else x for x in raw] if self.inferred else raw)
+            return
+
+        parse, na = _PARSERS.get(self.dtype, self.dtype), self.na
+        try:
+            parsed = [None if x in na else parse(x) for x in raw]
+        except ValueError:
+            if not self.inferred:
+                raise
+
+            # inferred types fall back to something more general
+            self._fallback(float if self.dtype is int else None, typed=self.dtype is int)
+            return self.extend(raw)
+
+        try:
+            self._append(parsed)
+        except OverflowError:
+            # e.g. ints that don't fit into 64 bits
+            self._fallback(self.dtype, typed=False)
+            self._append(parsed)
+
+    def finish(self) -> SimpleColumn:
+        if self.infer:
+            # every value was missing
+            return SimpleColumn([None] * self.n_leading_missing)
+
+        if not self.is_typed:
+            return SimpleColumn(self.values)
+
+        valid = memoryview(bytes(self.valid)) if self.valid is not None else None
+        return SimpleColumn._from_parts(memoryview(self.values), valid, self.dtype)
@@ -0,0 +1,75 @@
+// Render reactable tables in HTML pages (see reactable/_html.py).
+//
+// Each table is a div with a data-reactable-props attribute, naming a
+// <script type="application/json"> element that holds the table's props.
+// Props may be gzip compressed and base64 encoded, which is marked with
+// data-encoding="gzip+base64" on the script element.
+//
+// The reactable bundle is either embedded once in the page, in a script
+// element with id "reactable-bundle", or loaded from next to this file.
+//
+// This is a classic (rather than module) script, so it can add the import map
+// for react before any modules are loaded. React isn't embedded, so pages load
+// it from esm.sh, and need network access to show tables.
+(function () {
+  var REACT_VERSION = "18.2.0";
+  var scriptSrc = document.currentScript && document.currentScript.src;
+
+  if (!document.querySelector("script[data-reactable-importmap]")) {
+    var importMap = document.createElement("script");
+    importMap.type = "importmap";
+    importMap.dataset.reactableImportmap = "";
+    importMap.textContent = JSON.stringify({
+      imports: {
+        react: "https://esm.sh/react@" + REACT_VERSION,
+        "react-dom": "https://esm.sh/react-dom@" + REACT_VERSION,
+        "react-dom/client": "https://esm.sh/react-dom@" + REACT_VERSION + "/client",
+      },
+    });
+    document.head.appendChild(importMap);
+  }
+
+  function loadBundle() {
+    var embedded = document.getElementById("reactable-bundle");
+    if (embedded) {
+      var blob = new Blob([embedded.textContent], { type: "text/javascript" });
+      return import(URL.createObjectURL(blob));
+    }
+
+    return import(new URL("reactable-py.esm.js", scriptSrc).href);
+  }
+
+  async function decodeProps(el) {
+    var text = el.textContent;
+    if (el.dataset.encoding !== "gzip+base64") {
+      return JSON.parse(text);
+    }
+
+    var bytes = Uint8Array.from(atob(text.trim()), function (c) {
+      return c.charCodeAt(0);
+    });
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return JSON.parse(await new Response(stream).text());
+  }
+
+  async function renderTables() {
+    var modules = await Promise.all([import("react"), import("react-dom/client"), loadBundle()]);
+    var React = modules[0].default || modules[0];
+    var createRoot = modules[1].createRoot || modules[1].default.createRoot;
+    var Reactable = modules[2].default;
+
+    for (var el of document.querySelectorAll("[data-reactable-props]")) {
+      if (el.dataset.reactableRendered) continue;
+      el.dataset.reactableRendered = "true";
+
+      var props = await decodeProps(document.getElementById(el.dataset.reactableProps));
+      createRoot(el).render(React.createElement(Reactable, props));
+    }
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", renderTables);
+  } else {
+    renderTables();
+  }
+})();
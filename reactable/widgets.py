@@ -2,19 +2,31 @@ from __future__ import annotations
 
 import ipyreact
 
+from functools import cache
 from importlib_resources import files
 from pathlib import Path
-from typing import TYPE_CHECKING
+from traitlets import validate
+from typing import TYPE_CHECKING, Any
+
+from ._column_store import check_row_keys
 
 STATIC_FILES = files("reactable.static")
 
 if TYPE_CHECKING:
     from .models import Props
+    from ._column_store import ColumnStore
+    from ._tbl_data import DataFrameLike
+
 
+@cache
+def define_module():
+    """Register the reactable javascript bundle with ipyreact.
 
-# This ensures that the javascript is only loaded once, rather
-# than included in every widget instance. Note that
-ipyreact.define_module("reactable", Path(str(STATIC_FILES / "reactable-py.esm.js")))
+    This ensures that the javascript is only loaded once, rather than included in every
+    widget instance. It is deferred until the first widget is created, since it reads the
+    full bundle from disk.
+    """
+    ipyreact.define_module("reactable", Path(str(STATIC_FILES / "reactable-py.esm.js")))
 
 
 def embed_css():
@@ -43,9 +55,159 @@ def embed_css():
 
 class ReactableWidget(ipyreact.Widget):
     # _esm = Path(str(STATIC_FILES / "reactable-py.esm.js"))
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        data: ColumnStore | None = None,
+        row_key: str | None = None,
+        **kwargs,
+    ):
+        define_module()
         super().__init__(*args, **kwargs, _module="reactable", _type="default")
 
+        # the data shown in the widget, kept up to date by the update methods below.
+        # rows are identified by the row_key column, or else their original position.
+        self._data = data
+        self._row_key = row_key
+        if data is None:
+            self._row_ids = []
+        elif row_key is not None:
+            self._row_ids = list(data[row_key])
+            check_row_keys(self._row_ids, row_key)
+        else:
+            self._row_ids = list(range(data.n_rows))
+
+        self._next_row_id = len(self._row_ids)
+        self._updated = False
+
+    # widget state is serialized by the kernel, which only handles plain
+    # python values, so props are converted first (e.g. numpy scalars, and Decimals)
+
+    @validate("props")
+    def _validate_props(self, proposal):
+        from ._serialize import to_jsonable
+
+        return to_jsonable(proposal["value"])
+
+    # data updates ----
+    # these replace the data in the widget's props, so the table re-renders with the new
+    # rows. Unlike creating a new table, it keeps its sorting, filtering, and selection state.
+    # Updates are not incremental: the whole data prop is sent again after each one.
+
+    def _validate_update(self) -> ColumnStore:
+        if self._data is None:
+            raise ValueError("Updating rows requires a widget created by Reactable.to_widget().")
+
+        props = self.props
+        rendered = [
+            col["id"]
+            for col in props.get("columns", [])
+            if any(isinstance(col.get(k), list) for k in ["cell", "className", "style", "details"])
+        ]
+        if isinstance(props.get("rowClassName"), list) or isinstance(props.get("rowStyle"), list):
+            rendered.append("row_class or row_style")
+
+        if rendered:
+            raise NotImplementedError(
+                "Updating rows is not supported for tables with content rendered per row in "
+                f"Python. Use JS() functions instead.\n\nAffected: {rendered}"
+            )
+
+        return self._data
+
+    def _set_data(self, data: ColumnStore) -> None:
+        self._data = data
+
+        # updated widgets no longer match the table they were created from
+        self._updated = True
+        self.props = {**self.props, "data": data.to_props()}
+
+    def _row_positions(self, row_ids: list[Any]) -> list[int]:
+        positions = {row_id: ii for ii, row_id in enumerate(self._row_ids)}
+
+        missing = [row_id for row_id in row_ids if row_id not in positions]
+        if missing:
+            raise KeyError(f"Rows not found: {missing}")
+
+        return [positions[row_id] for row_id in row_ids]
+
+    def patch_cells(self, updates: dict[Any, dict[str, Any]]):
+        """Change the values of cells.
+
+        The widget sends all of its data again, not just the changed cells.
+
+        Parameters
+        ----------
+        updates:
+            A mapping of row id to a mapping of column name to its new value. Row ids are
+            values of the row_key column, or row positions in the original data. Changing
+            row_key values must leave them unique.
+        """
+        data = self._validate_update()
+        rows = self._row_positions(list(updates))
+
+        cells: dict[str, dict[int, Any]] = {}
+        for row, values in zip(rows, updates.values()):
+            for name, value in values.items():
+                cells.setdefault(name, {})[row] = value
+
+        patched = data.patch(cells)
+        if self._row_key in cells:
+            row_ids = list(patched[self._row_key])
+            check_row_keys(row_ids, self._row_key)
+            self._row_ids = row_ids
+
+        self._set_data(patched)
+
+    def append_rows(self, data: DataFrameLike | dict[str, list[Any]]):
+        """Add rows to the end of the table.
+
+        The widget sends all of its data again, including the rows it already had.
+
+        Parameters
+        ----------
+        data:
+            The rows to add, with the same columns as the table's data. Their row_key values
+            must not already be in the table.
+        """
+        from .models import process_data
+
+        crnt = self._validate_update()
+        new = process_data(data)
+        n_new = new.n_rows
+
+        new_ids = list(range(self._next_row_id, self._next_row_id + n_new))
+        if ".rownames" in crnt and ".rownames" not in new:
+            new = new.insert(".rownames", new_ids, first=True)
+
+        if self._row_key is not None:
+            new_ids = list(new[self._row_key])
+            check_row_keys([*self._row_ids, *new_ids], self._row_key)
+
+        self._set_data(crnt.concat(new))
+        self._row_ids.extend(new_ids)
+        self._next_row_id += n_new
+
+    def remove_rows(self, row_ids: list[Any]):
+        """Remove rows from the table.
+
+        The widget sends all of its remaining data again.
+
+        Parameters
+        ----------
+        row_ids:
+            The ids of rows to remove. Row ids are values of the row_key column, or row
+            positions in the original data.
+        """
+        data = self._validate_update()
+        rows = self._row_positions(row_ids)
+
+        removed = set(rows)
+        keep = [ii for ii in range(len(self._row_ids)) if ii not in removed]
+
+        self._set_data(data.take(keep))
+        self._row_ids = [self._row_ids[ii] for ii in keep]
+
     def tagify(self) -> str:
         # to appease htmltools
         return str(self)
@@ -0,0 +1,54 @@
+import polars as pl
+import pytest
+
+from reactable import Column, Reactable, options
+
+
+@pytest.fixture
+def df():
+    return pl.DataFrame(
+        {
+            "a": list(range(5_000)),
+            "b": [f"level {ii % 5}" for ii in range(5_000)],
+            "c": [ii / 3 for ii in range(5_000)],
+        }
+    )
+
+
+@pytest.fixture
+def budget():
+    yield
+    options.reset()
+
+
+def test_memory_usage_estimate(df):
+    usage = Reactable(df).memory_usage()
+
+    assert usage.n_rows == 5_000
+    assert usage.payload_bytes() == sum(usage.column_bytes().values())
+    assert set(usage.column_bytes()) == {"a", "b", "c"}
+
+    # the estimate is scaled up from a sample of rows
+    exact = len(str(Reactable(df).to_props()["data"]["b"]))
+    assert usage.column_bytes()["b"] == pytest.approx(exact, rel=0.1)
+
+
+def test_budget_warns(df, budget):
+    options.payload_budget = 1_000
+
+    # tables over budget are still sent in full
+    with pytest.warns(UserWarning, match="payload budget"):
+        tbl = Reactable(df)
+
+    assert not tbl.memory_usage().fits()
+    assert len(tbl.data["a"]) == 5_000
+
+
+def test_budget_counts_callback_output(df, budget):
+    options.payload_budget = 1_000
+
+    with pytest.warns(UserWarning, match="payload budget"):
+        tbl = Reactable(df, columns={"a": Column(cell=lambda ci: str(ci.value))})
+
+    usage = tbl.memory_usage()
+    assert usage.callback_bytes > 0
@@ -0,0 +1,129 @@
+import gc
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from reactable import Reactable, options
+from reactable._cache import PropsCache, fingerprint, get_props_cache
+from reactable._column_store import ColumnStore
+from reactable.simpleframe import SimpleFrame
+
+params_frames = [
+    pytest.param(pd.DataFrame, id="pandas"),
+    pytest.param(pl.DataFrame, id="polars"),
+    pytest.param(SimpleFrame, id="simpleframe"),
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_options():
+    yield
+    options.reset()
+
+
+@pytest.mark.parametrize("frame", params_frames)
+def test_fingerprint(frame):
+    def fp(data, config={}):
+        return fingerprint(ColumnStore.from_frame(frame(data)), config)
+
+    assert fp({"x": [1, 2], "y": [1.5, None]}) == fp({"x": [1, 2], "y": [1.5, None]})
+    assert fp({"x": [1, 2]}) is not None
+    assert fp({"x": [1, 2]}) != fp({"x": [1, 3]})
+    assert fp({"x": [1, 2]}) != fp({"z": [1, 2]})
+    assert fp({"x": [1, 2]}) != fp({"x": [1, 2]}, {"striped": True})
+
+
+@pytest.mark.parametrize("series", [pd.Series, pl.Series])
+def test_fingerprint_strings(series):
+    def fp(values):
+        return fingerprint(ColumnStore({"x": series(values)}), {})
+
+    assert fp(["a", None]) is not None
+    assert fp(["a", None]) == fp(["a", None])
+    assert fp(["a", None]) != fp(["a", "None"])
+    assert fp(["ab", "c"]) != fp(["a", "bc"])
+    assert fp(["a", "b", "c"][1:]) != fp(["a", "b"])
+
+
+def test_fingerprint_python_objects():
+    def fp(col):
+        return fingerprint(ColumnStore({"x": col}), {})
+
+    # python objects are quicker to convert than to hash, so aren't fingerprinted
+    assert fp(pd.Series([1, "a"], dtype=object)) is None
+    assert fp(["a", "b"]) is None
+    assert fp(SimpleFrame({"x": ["a", "b"]})["x"]) is None
+
+    # categories are hashed by value, with their types
+    assert fp(pd.Series(pd.Categorical([1, "a"]))) != fp(pd.Series(pd.Categorical(["1", "a"])))
+
+
+def test_props_cache_evicts_by_size():
+    cache = PropsCache(max_size=120)
+
+    cache.put("a", {"data": "x" * 40})
+    cache.put("b", {"data": "x" * 40})
+    cache.get("a")
+    cache.put("c", {"data": "x" * 40})
+
+    # b was the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.size <= 120
+
+    # entries larger than the cache are not stored
+    cache.put("d", {"data": "x" * 200})
+    assert cache.get("d") is None
+
+
+def test_repr_reuses_widget():
+    df = SimpleFrame({"x": [1, 2, 3]})
+
+    entry = Reactable(df)._cached_props()
+    assert Reactable(df)._cached_props() is entry
+    assert Reactable(df, striped=True)._cached_props() is not entry
+
+    Reactable(df)._repr_mimebundle_()
+    widget = entry.widget
+    Reactable(df)._repr_mimebundle_()
+    assert entry.widget is widget
+
+    # widgets whose data was changed are not re-used
+    widget.patch_cells({0: {"x": 10}})
+    Reactable(df)._repr_mimebundle_()
+    assert entry.widget is not widget
+
+
+def test_cache_does_not_keep_widgets_alive():
+    df = SimpleFrame({"x": [1, 2, 3]})
+    Reactable(df)._repr_mimebundle_()
+
+    entry = Reactable(df)._cached_props()
+    entry.widget.close()
+    gc.collect()
+
+    assert entry.widget is None
+
+
+def test_cache_skips_python_objects():
+    df = pd.DataFrame({"x": [1, "a"]}, dtype=object)
+    cache = get_props_cache(options.cache_size)
+    cache.clear()
+
+    assert Reactable(df)._cached_props() is not Reactable(df)._cached_props()
+    assert len(cache) == 0
+
+
+def test_cache_entry_size():
+    tbl = Reactable(pl.DataFrame({"x": list(range(1_000)), "y": ["a"] * 1_000}))
+
+    # entries are sized from the table's estimated memory usage
+    assert tbl._cached_props().size == tbl.memory_usage().sent_bytes
+
+
+def test_cache_disabled():
+    options.cache_size = 0
+    df = SimpleFrame({"x": [1, 2, 3]})
+
+    assert Reactable(df)._cached_props() is not Reactable(df)._cached_props()
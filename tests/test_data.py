@@ -0,0 +1,18 @@
+import reactable.data as data
+
+from reactable.simpleframe import SimpleFrame
+
+
+def test_data_loads_lazily():
+    vars(data).pop("sleep", None)
+
+    res = data.sleep
+    assert isinstance(res, SimpleFrame)
+
+    # loaded datasets are cached on the module
+    assert vars(data)["sleep"] is res
+    assert data.sleep is res
+
+
+def test_data_dir_lists_datasets():
+    assert set(data.__all__) <= set(dir(data))
@@ -0,0 +1,46 @@
+import base64
+import gzip
+import json
+import re
+
+import htmltools
+import pytest
+
+from reactable import Reactable, to_html
+from reactable._html import encode_props
+from reactable.simpleframe import SimpleFrame
+
+
+def _table_props(html):
+    pattern = r'data-encoding="gzip\+base64">(.*?)</script>'
+    blocks = re.findall(pattern, html, re.S)
+    return [json.loads(gzip.decompress(base64.b64decode(block))) for block in blocks]
+
+
+def test_to_html_embeds_assets_once(tmp_path):
+    tbl1 = Reactable(SimpleFrame({"x": [1, 2]}))
+    tbl2 = Reactable(SimpleFrame({"y": ["a", "b"]}))
+
+    html = to_html(tbl1, htmltools.tags.p("between"), tbl2, path=tmp_path / "page.html")
+
+    assert (tmp_path / "page.html").read_text() == html
+    assert html.count('id="reactable-bundle"') == 1
+    assert html.count("<style>") == 1
+    assert html.count("data-reactable-props=") == 2
+
+    props1, props2 = _table_props(html)
+    assert props1["data"] == {"x": [1, 2]}
+    assert props2["data"] == {"y": ["a", "b"]}
+
+
+def test_tagify_uses_dependency():
+    rendered = htmltools.TagList(Reactable(SimpleFrame({"x": [1]}))).render()
+
+    assert [dep.name for dep in rendered["dependencies"]] == ["reactable"]
+
+
+def test_encode_props_escapes_script():
+    res = encode_props({"data": {"x": ["</script>"]}}, compress=False)
+
+    assert "</script>" not in res
+    assert json.loads(res) == {"data": {"x": ["</script>"]}}
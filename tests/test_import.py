@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_load_jupyter():
+    code = (
+        "import sys, reactable\n"
+        "from reactable.simpleframe import SimpleFrame\n"
+        "reactable.Reactable(SimpleFrame({'x': [1, 2]})).to_props()\n"
+        "print(sorted(m for m in ('ipyreact', 'ipywidgets', 'IPython') if m in sys.modules))"
+    )
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert res.stdout.strip() == "[]"
+
+
+def test_lazy_widget_attrs():
+    import reactable
+    from reactable.widgets import ReactableWidget, bigblock
+
+    assert reactable.ReactableWidget is ReactableWidget
+    assert reactable.reactable is bigblock
+    assert "render" in dir(reactable)
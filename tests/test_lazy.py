@@ -0,0 +1,35 @@
+import polars as pl
+import pytest
+
+from reactable import Reactable
+
+
+@pytest.fixture
+def path(tmp_path):
+    df = pl.DataFrame(
+        {
+            "x": [ii if ii % 7 else None for ii in range(50)],
+            "y": [f"Row_{ii % 3}" for ii in range(50)],
+            "z": [float(ii) for ii in range(50)],
+        }
+    )
+    df.write_parquet(tmp_path / "data.parquet", row_group_size=10)
+    return tmp_path / "data.parquet"
+
+
+def test_lazy_frame(path):
+    tbl = Reactable(pl.scan_parquet(path))
+
+    assert tbl.data["x"][:5] == [None, 1, 2, 3, 4]
+    assert tbl.data.n_rows == 50
+    assert [col.type for col in tbl.columns] == ["numeric", "character", "numeric"]
+
+    # collected frames are kept as polars columns, like eager frames
+    assert isinstance(tbl.data.get_column("x"), pl.Series)
+
+
+def test_lazy_frame_matches_eager(path):
+    lazy = Reactable(pl.scan_parquet(path).filter(pl.col("z") > 10).select("x", "y"))
+    eager = Reactable(pl.read_parquet(path).filter(pl.col("z") > 10).select("x", "y"))
+
+    assert lazy.to_props() == eager.to_props()
@@ -2,7 +2,8 @@ import pandas as pd
 import polars as pl
 import pytest
 
-from reactable import Reactable
+from reactable import Reactable, Column
+from reactable._column_store import ColumnStore
 from reactable.simpleframe import SimpleFrame
 
 params_frames = [
@@ -19,6 +20,128 @@ def df(request):
 
 def test_frame(df):
     d = Reactable(df)
-    assert isinstance(d.data, dict)
+    assert isinstance(d.data, ColumnStore)
     assert d.data["a"] == [1, 2]
     assert d.data["b"] == ["3", "4"]
+
+
+def test_frame_keeps_native_columns(df):
+    d = Reactable(df, rownames=True)
+
+    assert isinstance(d.data.get_column("a"), type(df["a"]))
+    assert d.to_props()["data"] == {".rownames": [0, 1], "a": [1, 2], "b": ["3", "4"]}
+
+
+def test_frame_callback_values(df):
+    d = Reactable(df, columns={"a": Column(cell=lambda ci: f"{ci.value}!")})
+
+    assert d.columns[0].cell == ["1!", "2!"]
+
+
+def test_frame_callback_vectorized(df):
+    def style(col):
+        assert isinstance(col, type(df["a"]))
+        return [{"color": "red" if x > 1 else "blue"} for x in col]
+
+    d = Reactable(
+        df,
+        columns={
+            "a": Column(
+                style=style,
+                cell=lambda col: [f"{x}!" for x in col],
+                footer=lambda ci: str(sum(ci.values)),
+                vectorized=True,
+            )
+        },
+    )
+
+    col = d.columns[0]
+    assert col.cell == ["1!", "2!"]
+    assert col.style == [{"color": "blue"}, {"color": "red"}]
+    assert col.footer == "3"
+    assert "vectorized" not in col.to_props()
+
+
+def test_frame_callback_vectorized_length():
+    with pytest.raises(ValueError):
+        Reactable(
+            SimpleFrame({"a": [1, 2]}),
+            columns={"a": Column(cell=lambda col: ["x"], vectorized=True)},
+        )
+
+
+def _style_cell(ci):
+    return {"width": f"{ci.value}px"}
+
+
+@pytest.mark.parametrize("workers", [3, "thread_pool"])
+def test_callbacks_workers(workers):
+    from concurrent.futures import ThreadPoolExecutor
+
+    df = SimpleFrame({"a": list(range(50))})
+    expected = Reactable(
+        df, columns={"a": Column(style=_style_cell)}, details=lambda ri: ri.row_index
+    )
+
+    if workers == "thread_pool":
+        workers = ThreadPoolExecutor(2)
+
+    res = Reactable(
+        df,
+        columns={"a": Column(style=_style_cell)},
+        details=lambda ri: ri.row_index,
+        row_class=lambda ii: f"row-{ii}",
+        workers=workers,
+    )
+
+    assert res.columns[1].style == expected.columns[1].style
+    assert res.columns[0].details == list(range(50))
+    assert res.row_class_name[49] == "row-49"
+
+
+def test_callbacks_workers_raises():
+    def cell(ci):
+        if ci.row_index == 7:
+            raise KeyError(ci.row_index)
+
+        return ""
+
+    with pytest.raises(KeyError):
+        Reactable(SimpleFrame({"a": list(range(20))}), columns={"a": Column(cell=cell)}, workers=4)
+
+
+def test_callbacks_cache():
+    calls = []
+
+    def cell(ci):
+        calls.append(ci.value)
+        return {"name": "span", "value": ci.value}
+
+    df = SimpleFrame({"a": ["x", "y", "x", "x", "y"]})
+    res = Reactable(df, columns={"a": Column(cell=cell, cache="value")})
+
+    cells = res.columns[0].cell
+    assert calls == ["x", "y"]
+    assert [c["value"] for c in cells] == ["x", "y", "x", "x", "y"]
+    assert cells[0] is cells[2]
+
+
+def test_callbacks_cache_lru():
+    calls = []
+
+    def cell(ci):
+        calls.append(ci.value)
+        return str(ci.value)
+
+    df = SimpleFrame({"a": ["x", "y", "z", "x"]})
+    res = Reactable(df, columns={"a": Column(cell=cell, cache=2)})
+
+    # x is evicted by z, so rendered again
+    assert calls == ["x", "y", "z", "x"]
+    assert res.columns[0].cell == ["x", "y", "z", "x"]
+    assert "cache" not in res.columns[0].to_props()
+
+
+def test_callbacks_cache_invalid():
+    with pytest.raises(ValueError):
+        Column(cell=str, cache="row")
@@ -0,0 +1,56 @@
+import polars as pl
+import pytest
+
+from reactable import Column, Reactable, options, profile
+
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+
+def test_profile_records_phases_and_columns(df):
+    with profile() as report:
+        Reactable(df, columns={"a": Column(cell=lambda ci: str(ci.value))}).to_props()
+
+    phases = report.by_phase()
+    assert {"default_columns", "process_data", "columns", "init_data", "encode"} <= set(phases)
+    assert phases["to_props"].payload_bytes > 0
+    assert phases["init_data"].peak_memory is not None
+
+    by_column = report.by_column()
+    assert set(by_column) == {"a", "b"}
+    assert (
+        by_column["a"].payload_bytes
+        == phases["encode"].payload_bytes - by_column["b"].payload_bytes
+    )
+
+    assert {"phase", "column", "seconds"} <= set(report.to_dicts()[0])
+    assert "init_data" in str(report)
+
+
+def test_profile_without_memory(df):
+    with profile(memory=False) as report:
+        Reactable(df).to_props()
+
+    assert all(record.peak_memory is None for record in report)
+
+
+def test_profile_only_records_inside_block(df):
+    with profile() as report:
+        pass
+
+    Reactable(df).to_props()
+    assert len(report) == 0
+
+
+def test_options_instrument(df):
+    records = []
+    options.instrument = records.append
+    try:
+        Reactable(df, row_style=lambda ri: {"color": "red"})
+    finally:
+        options.reset()
+
+    assert "row_style" in [record.phase for record in records]
+    assert options.instrument is None
@@ -0,0 +1,131 @@
+import pytest
+
+from reactable import options
+
+gt = pytest.importorskip("great_tables")
+
+from great_tables import GT, exibble, loc, style  # noqa: E402
+
+from reactable._render_gt import extract_cells, gt_fingerprint  # noqa: E402
+
+SUFFIX = "kg"
+
+
+def fmt_weight(x):
+    return f"{x:.0f} {SUFFIX}"
+
+
+@pytest.fixture(autouse=True)
+def reset_options():
+    yield
+    options.reset()
+
+
+def make_gt(decimals=1, data=exibble):
+    return (
+        GT(data)
+        .fmt_number("num", decimals=decimals)
+        .fmt_date("date")
+        .sub_missing()
+        .tab_style(style.fill("red"), loc.body("num", rows=[0]))
+    )
+
+
+@pytest.fixture
+def n_builds(monkeypatch):
+    calls = []
+    build_data = GT._build_data
+
+    def counted(self, *args, **kwargs):
+        calls.append(1)
+        return build_data(self, *args, **kwargs)
+
+    monkeypatch.setattr(GT, "_build_data", counted)
+    return calls
+
+
+def test_gt_fingerprint():
+    fp = gt_fingerprint(make_gt())
+
+    # rebuilt tables, and ones with only a new heading, have the same cells
+    assert gt_fingerprint(make_gt()) == fp
+    assert gt_fingerprint(make_gt().tab_header("A title")) == fp
+
+    assert gt_fingerprint(make_gt(decimals=2)) != fp
+    assert gt_fingerprint(make_gt(data=exibble.assign(num=exibble["num"] * 2))) != fp
+    assert gt_fingerprint(make_gt().tab_style(style.text(weight="bold"), loc.body("char"))) != fp
+
+
+def test_gt_fingerprint_unknown_values():
+    class Opaque:
+        __slots__ = ()
+
+    tbl = GT(exibble).fmt(lambda x, opaque=Opaque(): str(x), columns="num")
+
+    assert gt_fingerprint(tbl) is None
+
+
+def test_gt_fingerprint_function_globals(monkeypatch):
+    tbl = GT(exibble).fmt(fmt_weight, columns="num")
+    fp = gt_fingerprint(tbl)
+    assert extract_cells(tbl, "num")["num"][1] == "2 kg"
+
+    # functions are re-run when a global they read changes
+    monkeypatch.setitem(globals(), "SUFFIX", "lb")
+    assert gt_fingerprint(tbl) != fp
+    assert extract_cells(tbl, "num")["num"][1] == "2 lb"
+
+
+def test_extract_cells_cached(n_builds):
+    cells = extract_cells(make_gt(), ["num", "char"])
+    assert extract_cells(make_gt().tab_header("A title"), ["num", "char"]) is cells
+    assert len(n_builds) == 1
+
+    extract_cells(make_gt(decimals=2), ["num", "char"])
+    assert len(n_builds) == 2
+    assert cells["num"][0] == "0.1"
+
+
+def test_extract_cells_cache_disabled(n_builds):
+    options.cache_size = 0
+
+    extract_cells(make_gt(), "num")
+    extract_cells(make_gt(), "num")
+    assert len(n_builds) == 2
+
+
+class Suffix:
+    def __init__(self, suffix):
+        self.suffix = suffix
+
+    def __call__(self, x):
+        return f"{x:.0f} {self.suffix}"
+
+
+fmt_suffix = Suffix("kg")
+
+
+def fmt_with_suffix(x):
+    return fmt_suffix(x)
+
+
+def fmt_nested(x):
+    return fmt_weight(x)
+
+
+def test_gt_fingerprint_callable_globals(monkeypatch):
+    tbl = GT(exibble).fmt(fmt_with_suffix, columns="num")
+    assert extract_cells(tbl, "num")["num"][1] == "2 kg"
+
+    # callable instances are hashed by their attributes
+    monkeypatch.setitem(globals(), "fmt_suffix", Suffix("lb"))
+    assert extract_cells(tbl, "num")["num"][1] == "2 lb"
+
+
+def test_gt_fingerprint_nested_function_globals(monkeypatch):
+    tbl = GT(exibble).fmt(fmt_nested, columns="num")
+    assert extract_cells(tbl, "num")["num"][1] == "2 kg"
+
+    # globals read by global functions are followed too
+    monkeypatch.setitem(globals(), "SUFFIX", "lb")
+    assert extract_cells(tbl, "num")["num"][1] == "2 lb"
@@ -0,0 +1,139 @@
+import json
+
+from importlib.util import find_spec
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from reactable import Reactable
+from reactable._serialize import dumps, iter_dumps, to_jsonable
+
+needs_orjson = pytest.mark.skipif(find_spec("orjson") is None, reason="requires orjson")
+
+BACKENDS = ["json", pytest.param("orjson", marks=needs_orjson)]
+
+VALUES = [
+    (np.int64(3), 3),
+    (np.float32(1.5), 1.5),
+    (np.bool_(True), True),
+    (np.array([1, 2]), [1, 2]),
+    (np.datetime64("2024-01-01T00:00"), "2024-01-01T00:00"),
+    (Decimal("1.10"), 1.1),
+    (Decimal("12345678901234567890"), 12345678901234567890),
+    (Decimal("NaN"), None),
+    (datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2))), "2024-01-01T00:00:00+02:00"),
+    (pd.Timestamp("2024-01-01", tz="UTC"), "2024-01-01T00:00:00+00:00"),
+    (date(2024, 1, 2), "2024-01-02"),
+    (time(1, 2), "01:02:00"),
+    (timedelta(days=1), "1 day, 0:00:00"),
+    (float("nan"), None),
+    (float("inf"), None),
+    (pd.NaT, None),
+    (pd.NA, None),
+    (2**70, 2**70),
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_native_types(backend):
+    values, expected = zip(*VALUES)
+
+    assert json.loads(dumps({"x": list(values)}, backend)) == {"x": list(expected)}
+
+
+@needs_orjson
+def test_dumps_backends_match():
+    props = {"data": {"x": [val for val, _ in VALUES]}, 1: {}, "y": []}
+
+    assert dumps(props, "json") == dumps(props, "orjson")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_iter_dumps_chunks_long_lists(backend):
+    props = {"data": {"x": list(range(25)), "y": [Decimal("0.5")] * 3}, "empty": {}, 2: None}
+    chunks = list(iter_dumps(props, chunk_size=10, backend=backend))
+
+    assert b"".join(chunks) == dumps(props, backend)
+    assert len(chunks) > 5
+
+
+def test_to_jsonable_keeps_plain_lists_and_buffers():
+    values = [1, "a", None]
+    buffer = memoryview(b"abc")
+    res = to_jsonable({"x": values, "y": {"data": buffer}, "z": [Decimal("1.5"), np.int64(2)]})
+
+    assert res["x"] is values
+    assert res["y"]["data"] is buffer
+    assert res["z"] == [1.5, 2]
+    assert to_jsonable([1.0, float("nan")]) == [1.0, None]
+
+
+@pytest.mark.parametrize("value, expected", VALUES)
+def test_to_jsonable_native_types(value, expected):
+    assert to_jsonable({"x": [value]}) == {"x": [expected]}
+
+
+def test_table_with_decimals_and_timezones():
+    df = pd.DataFrame(
+        {
+            "d": [Decimal("1.25"), None],
+            "t": pd.to_datetime(["2024-01-01T00:00+02:00", None]),
+        }
+    )
+    props = Reactable(df).to_props()
+
+    assert json.loads(dumps(props))["data"] == {
+        "d": [1.25, None],
+        "t": ["2024-01-01T00:00:00+02:00", None],
+    }
+
+
+def test_props_polars_data():
+    df = pl.DataFrame({"x": [1, None], "y": [date(2024, 1, 2), None], "z": ["a", "a"]})
+    props = Reactable(df).to_props()
+
+    assert props["data"] == {"x": [1, None], "y": [date(2024, 1, 2), None], "z": ["a", "a"]}
+
+
+def test_props_pandas_data():
+    df = pd.DataFrame({"x": pd.array([1, None], dtype="Int64"), "y": [1.5, float("nan")]})
+    props = Reactable(df).to_props()
+
+    assert props["data"] == {"x": [1, None], "y": [1.5, None]}
+
+
+@pytest.mark.parametrize(
+    "col",
+    [
+        pd.Series(["b", None, "b"], dtype="category"),
+        pl.Series(["b", None, "b"], dtype=pl.Categorical),
+        pl.Series(["b", None, "b"], dtype=pl.Enum(["a", "b"])),
+    ],
+)
+def test_props_categorical_data(col):
+    df = pd.DataFrame({"x": col}) if isinstance(col, pd.Series) else pl.DataFrame({"x": col})
+    props = Reactable(df).to_props()
+
+    assert props["data"] == {"x": ["b", None, "b"]}
+    assert props["columns"][0]["type"] == "factor"
+
+
+def test_props_temporal_data():
+    values = {
+        "d": [date(2024, 1, 2), None],
+        "dt": [datetime(2024, 1, 2, 3, 4, tzinfo=timezone.utc), None],
+        "td": [timedelta(seconds=90), None],
+    }
+    expected = {
+        "d": ["2024-01-02", None],
+        "dt": ["2024-01-02T03:04:00+00:00", None],
+        "td": ["0:01:30", None],
+    }
+
+    for df in [pl.DataFrame(values), pd.DataFrame(values).astype({"td": "timedelta64[ns]"})]:
+        data = Reactable(df).to_props()["data"]
+        assert json.loads(dumps(data)) == expected
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 from reactable.simpleframe import SimpleFrame, SimpleColumn
 
@@ -21,3 +24,113 @@ def test_getitem(ii, k, dst):
         assert isinstance(res, SimpleFrame)
 
         assert res.equals(dst)
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([1, None, 3], int),
+        ([1.5, None], float),
+        ([True, None, False], bool),
+        (["a", None], None),
+        ([1, "a"], None),
+        ([2**70], None),
+    ],
+)
+def test_column_storage(values, dtype):
+    col = SimpleColumn(values)
+
+    assert col.dtype is dtype
+    assert col.to_list() == values
+    assert [col[ii] for ii in range(len(col))] == values
+
+
+def test_column_slice_is_view():
+    col = SimpleColumn([1.0, None, 3.0, 4.0])
+    sliced = col[1::2]
+
+    assert sliced.to_list() == [None, 4.0]
+    assert sliced.buffer.obj is col.buffer.obj
+    assert col[[3, 0]].to_list() == [4.0, 1.0]
+
+
+@pytest.mark.parametrize("values", [[1, None, 3], [1.5, 2.5], [True, None], ["a", None]])
+def test_column_pickle_and_copy(values):
+    # a strided slice, whose memoryview is not contiguous
+    col = SimpleColumn([val for val in values for _ in range(2)])[::2]
+
+    for res in [pickle.loads(pickle.dumps(col)), copy.deepcopy(col)]:
+        assert res.dtype is col.dtype
+        assert res.to_list() == values
+
+    frame = SimpleFrame({"x": values})
+    assert pickle.loads(pickle.dumps(frame)) == frame
+
+
+@pytest.mark.parametrize("values", [[1, None, 3], [1.5, 2.5], [True, None], ["a", None]])
+def test_column_to_pandas_polars(values):
+    col = SimpleColumn(values)
+
+    assert col.to_pandas().astype(object).where(lambda x: x.notna(), None).tolist() == values
+    assert col.to_polars().to_list() == values
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [([1, 2], "Int64"), ([1.5, 2.5], "Float64"), ([True, False], "boolean"), (["a"], "object")],
+)
+def test_column_to_pandas_dtype(values, dtype):
+    # typed columns are nullable pandas arrays, with or without missing values
+    assert SimpleColumn(values).to_pandas().dtype == dtype
+    assert SimpleColumn([*values, None]).to_pandas().dtype == dtype
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    p = tmp_path / "data.csv"
+    p.write_text("a,b,c,d\n1,x,1,TRUE\n2,y,NA,false\nNA,z,2.5,TRUE\n")
+    return p
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 10_000])
+def test_read_csv_dtypes(csv_file, chunksize):
+    res = SimpleFrame.read_csv(
+        csv_file, dtypes={"a": int, "d": bool}, na_values="NA", chunksize=chunksize
+    )
+
+    assert res["a"].dtype is int
+    assert res["a"].to_list() == [1, 2, None]
+    assert res["d"].to_list() == [True, False, True]
+    assert res["c"].to_list() == ["1", "NA", "2.5"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 10_000])
+def test_read_csv_infer_types(csv_file, chunksize):
+    res = SimpleFrame.read_csv(csv_file, na_values="NA", infer_types=True, chunksize=chunksize)
+
+    assert res["a"].to_list() == [1, 2, None]
+    assert res["b"].to_list() == ["x", "y", "z"]
+    assert res["c"].dtype is float
+    assert res["c"].to_list() == [1.0, None, 2.5]
+    assert res["d"].dtype is bool
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 10_000])
+def test_read_csv_infer_types_fallback(tmp_path, chunksize):
+    p = tmp_path / "data.csv"
+    p.write_text("a,b,c,d\n007,true,1.50,NA\nNA,false,NA,x\n2,NA,2,NA\nx,maybe,y,z\n")
+
+    res = SimpleFrame.read_csv(p, na_values="NA", infer_types=True, chunksize=chunksize)
+
+    # columns that fall back to strings keep values as written, with missing values as None
+    assert res.to_dict() == {
+        "a": ["007", None, "2", "x"],
+        "b": ["true", "false", None, "maybe"],
+        "c": ["1.50", None, "2", "y"],
+        "d": [None, "x", None, "z"],
+    }
+
+
+def test_read_csv_bad_value(csv_file):
+    with pytest.raises(ValueError):
+        SimpleFrame.read_csv(csv_file, dtypes={"b": int})
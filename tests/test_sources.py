@@ -0,0 +1,58 @@
+import sqlite3
+
+import polars as pl
+import pytest
+
+from reactable import Reactable, data_source
+from reactable._sources import IterableSource
+
+
+def _rows(n, seen):
+    for ii in range(n):
+        seen.append(ii)
+        yield {"x": ii, "y": f"row {ii}"}
+
+
+def test_generator_fetches_all_rows():
+    seen = []
+    tbl = Reactable(_rows(1000, seen), default_page_size=5)
+
+    assert tbl.data["x"] == list(range(1000))
+    assert tbl.columns[0].type == "numeric"
+    assert len(seen) == 1000
+
+
+def test_cursor():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE t (x INTEGER, y TEXT)")
+    con.executemany("INSERT INTO t VALUES (?, ?)", [(ii, str(ii)) for ii in range(250)])
+
+    tbl = Reactable(con.execute("SELECT * FROM t"), default_page_size=10)
+
+    assert tbl.data["x"] == list(range(250))
+    assert tbl.data["y"][-1] == "249"
+
+
+def test_batches():
+    batches = (pl.DataFrame({"x": list(range(ii, ii + 30))}) for ii in range(0, 90, 30))
+    source = IterableSource(batches)
+
+    assert source.to_frame(40).columns["x"].to_list() == list(range(40))
+    assert source.fetch_to()["x"] == list(range(90))
+
+
+def test_sequence_rows_need_columns():
+    assert Reactable(data_source(iter([(1, "a")]), columns=["x", "y"])).data == {
+        "x": [1],
+        "y": ["a"],
+    }
+
+    with pytest.raises(ValueError):
+        Reactable(iter([(1, "a")]))
+
+
+def test_empty_source():
+    assert Reactable(data_source(iter([]), columns=["x"])).data.n_rows == 0
+
+    with pytest.raises(ValueError, match="empty"):
+        Reactable(iter([]))
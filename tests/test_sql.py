@@ -0,0 +1,81 @@
+import sqlite3
+
+import pytest
+
+from reactable import Reactable, sql_table
+from reactable._tbl_data import sql_col_type
+
+
+def _connect(backend):
+    if backend == "duckdb":
+        duckdb = pytest.importorskip("duckdb")
+        return duckdb.connect(":memory:")
+
+    return sqlite3.connect(":memory:")
+
+
+@pytest.fixture(params=["sqlite", "duckdb"])
+def con(request):
+    con = _connect(request.param)
+    con.execute("CREATE TABLE t (x INTEGER, y VARCHAR(10), d DATE)")
+    con.executemany(
+        "INSERT INTO t VALUES (?, ?, ?)",
+        [
+            (ii if ii % 7 else None, f"Row_{ii % 3}", f"2024-01-{ii % 28 + 1:02}")
+            for ii in range(50)
+        ],
+    )
+    return con
+
+
+def test_sql_table(con):
+    tbl = Reactable(sql_table(con, "t"), default_page_size=5)
+
+    assert tbl.data["x"][:5] == [None, 1, 2, 3, 4]
+    assert tbl.data.n_rows == 50
+    assert [col.type for col in tbl.columns] == ["numeric", "character", "Date"]
+
+
+def test_sql_table_query(con):
+    tbl = Reactable(sql_table(con, query="SELECT x * 2 AS x2 FROM t WHERE x < 10"))
+
+    assert tbl.data["x2"] == [2, 4, 6, 8, 10, 12, 16, 18]
+    assert [col.type for col in tbl.columns] == ["numeric"]
+
+
+def test_sql_table_runs_query_once():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE big (x INTEGER)")
+    con.executemany("INSERT INTO big VALUES (?)", [(ii,) for ii in range(1_000)])
+
+    statements = []
+    con.set_trace_callback(statements.append)
+    tbl = Reactable(sql_table(con, "big"))
+
+    assert tbl.data["x"] == list(range(1_000))
+    assert [sql for sql in statements if sql.startswith("SELECT")] == ['SELECT * FROM "big"']
+
+
+def test_sql_table_requires_table_or_query(con):
+    with pytest.raises(ValueError):
+        sql_table(con)
+
+    with pytest.raises(ValueError):
+        sql_table(con, "t", query="SELECT * FROM t")
+
+
+@pytest.mark.parametrize(
+    "decl, dst",
+    [
+        ("INTEGER", "numeric"),
+        ("DECIMAL(10, 2)", "numeric"),
+        ("VARCHAR(20)", "character"),
+        ("BOOLEAN", "logical"),
+        ("TIMESTAMP WITH TIME ZONE", "Date"),
+        ("ENUM('a', 'b')", "factor"),
+        ("INTERVAL", None),
+        ("", None),
+    ],
+)
+def test_sql_col_type(decl, dst):
+    assert sql_col_type(decl) == dst
@@ -3,7 +3,7 @@ import polars as pl
 import polars.testing
 import pytest
 
-from reactable._tbl_data import subset_frame, SimpleFrame, SimpleColumn
+from reactable._tbl_data import col_type, subset_frame, to_dict, SimpleFrame, SimpleColumn
 
 params_frames = [pytest.param(pd.DataFrame, id="pandas"), pytest.param(pl.DataFrame, id="polars")]
 params_series = [pytest.param(pd.Series, id="pandas"), pytest.param(pl.Series, id="polars")]
@@ -38,3 +38,34 @@ def test_subset_frame(df):
         df.__class__({"col1": [1, 3], "col3": [4.0, 6.0]}),
         include_index=False,
     )
+
+
+@pytest.mark.parametrize(
+    "ser, dst",
+    [
+        (pd.Series([1, 2]), "numeric"),
+        (pd.Series([1, None], dtype="Int64"), "numeric"),
+        (pd.Series([True, False]), "logical"),
+        (pd.Series(["a", "b"], dtype="category"), "factor"),
+        (pd.Series(pd.to_datetime(["2020-01-01"])), "Date"),
+        (pd.Series(["a", "b"], dtype="string"), "character"),
+        (pd.Series([None, "a"], dtype=object), "character"),
+    ],
+)
+def test_col_type_pandas(ser, dst):
+    assert col_type(ser) == dst
+
+
+def test_to_dict_pandas_nulls():
+    df = pd.DataFrame(
+        {
+            "x": [1.0, float("nan")],
+            "y": pd.Series(["a", None], dtype="category"),
+            "z": pd.to_datetime(["2020-01-01", None]),
+        }
+    )
+
+    res = to_dict(df)
+    assert res["x"] == [1.0, None]
+    assert res["y"] == ["a", None]
+    assert res["z"] == [pd.Timestamp("2020-01-01"), None]
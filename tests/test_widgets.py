@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from decimal import Decimal
+
+from reactable import Reactable, Column
+from reactable.widgets import ReactableWidget
+from reactable.simpleframe import SimpleFrame
+
+
+@pytest.fixture
+def widget():
+    return Reactable(SimpleFrame({"id": ["a", "b", "c"], "x": [1, 2, 3]}), row_key="id").to_widget()
+
+
+def test_widget_state_is_plain_values():
+    widget = ReactableWidget(props={"data": {"x": [np.int64(1), Decimal("1.5"), float("nan")]}})
+    state = widget.get_state()["props"]
+
+    assert state == {"data": {"x": [1, 1.5, None]}}
+    assert [type(val) for val in state["data"]["x"]] == [int, float, type(None)]
+
+    widget.props = {"data": {"x": np.array([2, 3])}}
+    assert widget.get_state()["props"] == {"data": {"x": [2, 3]}}
+
+
+def test_widget_patch_cells(widget):
+    widget.patch_cells({"c": {"x": 30}, "a": {"x": 10}})
+
+    # the widget re-renders with the data in its props
+    assert widget.props["data"] == {"id": ["a", "b", "c"], "x": [10, 2, 30]}
+    assert widget._data.to_dict() == {"id": ["a", "b", "c"], "x": [10, 2, 30]}
+
+
+def test_widget_append_and_remove_rows(widget):
+    widget.append_rows(SimpleFrame({"id": ["d"], "x": [4]}))
+    assert widget.props["data"] == {"id": ["a", "b", "c", "d"], "x": [1, 2, 3, 4]}
+
+    widget.remove_rows(["b", "d"])
+    assert widget.props["data"] == {"id": ["a", "c"], "x": [1, 3]}
+
+    # rows are found by id, rather than position
+    widget.patch_cells({"c": {"x": 0}})
+    assert widget.props["data"] == {"id": ["a", "c"], "x": [1, 0]}
+
+
+def test_widget_updates_default_row_ids():
+    widget = Reactable(SimpleFrame({"x": [1, 2, 3]}), rownames=True).to_widget()
+
+    widget.remove_rows([0])
+    widget.append_rows({"x": [4]})
+    widget.patch_cells({3: {"x": 40}})
+
+    assert widget.props["data"] == {".rownames": [1, 2, 3], "x": [2, 3, 40]}
+
+    with pytest.raises(KeyError):
+        widget.remove_rows([0])
+
+
+def test_widget_updates_python_renderers_raises():
+    tbl = Reactable(SimpleFrame({"x": [1, 2]}), columns={"x": Column(cell=lambda ci: "!")})
+
+    widget = tbl.to_widget()
+    with pytest.raises(NotImplementedError):
+        widget.append_rows({"x": [3]})
+
+    # failed updates leave the widget as it was, so it can still be re-used
+    assert not widget._updated
+
+
+def test_widget_row_keys_unique(widget):
+    with pytest.raises(ValueError, match="unique"):
+        Reactable(SimpleFrame({"id": ["a", "a"], "x": [1, 2]}), row_key="id")
+
+    with pytest.raises(ValueError, match="unique"):
+        widget.append_rows(SimpleFrame({"id": ["a"], "x": [4]}))
+
+    with pytest.raises(ValueError, match="unique"):
+        widget.patch_cells({"c": {"id": "b"}})
+
+    # failed updates leave the data as it was
+    assert widget.props["data"] == {"id": ["a", "b", "c"], "x": [1, 2, 3]}
+    widget.patch_cells({"c": {"x": 30}})
+    assert widget.props["data"] == {"id": ["a", "b", "c"], "x": [1, 2, 30]}